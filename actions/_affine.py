@@ -0,0 +1,38 @@
+"""
+Affine Transform Helpers for Right-click Utilities and Shortcuts Hub
+
+Builds QTransform matrices for the editing actions so that rotation, scaling and
+translation around a pivot are applied to a geometry in a single native pass.
+"""
+
+from qgis.PyQt.QtGui import QTransform
+
+
+def build_affine(cx, cy, angle=0.0, sx=1.0, sy=1.0, tx=0.0, ty=0.0):
+    """
+    Compose rotation, scaling and translation around a pivot into one transform.
+    
+    Points are scaled and rotated around (cx, cy), then translated by (tx, ty).
+    The rotation direction matches QgsGeometry.rotate (clockwise for positive angles).
+    
+    Args:
+        cx (float): Pivot X coordinate
+        cy (float): Pivot Y coordinate
+        angle (float): Clockwise rotation in degrees
+        sx (float): Scale factor along X
+        sy (float): Scale factor along Y
+        tx (float): Translation along X
+        ty (float): Translation along Y
+    
+    Returns:
+        QTransform: Transform to pass to QgsGeometry.transform
+    """
+    transform = QTransform()
+    transform.translate(cx + tx, cy + ty)
+    if angle:
+        # QTransform rotates counter-clockwise in map (Y-up) coordinates
+        transform.rotate(-angle)
+    if sx != 1.0 or sy != 1.0:
+        transform.scale(sx, sy)
+    transform.translate(-cx, -cy)
+    return transform
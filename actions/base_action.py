@@ -6,6 +6,7 @@ It provides common functionality and ensures consistent behavior across all acti
 """
 
 from abc import ABC, abstractmethod
+from types import SimpleNamespace
 from qgis.PyQt.QtWidgets import QMessageBox
 from qgis.core import QgsFeature, QgsVectorLayer, QgsPointXY
 from qgis.gui import QgsMapCanvas
@@ -38,6 +39,9 @@ class BaseAction(ABC):
         # Valid scope options - enforced by the system
         self.VALID_SCOPES = ['feature', 'layer', 'universal']
         
+        # Settings snapshot for actions that cache their settings, cleared on change
+        self._settings_cache = None
+        
     @abstractmethod
     def execute(self, context):
         """
@@ -232,6 +236,22 @@ class BaseAction(ABC):
         """
         QMessageBox.information(None, title, message)
     
+    def show_success(self, title, message):
+        """
+        Show a non-blocking success notification in the QGIS message bar.
+        
+        Falls back to an information dialog when no QGIS interface is available.
+        
+        Args:
+            title (str): Notification title
+            message (str): Success message
+        """
+        from qgis.utils import iface
+        if iface is None:
+            self.show_info(title, message)
+            return
+        iface.messageBar().pushSuccess(title, message)
+    
     def show_warning(self, title, message):
         """
         Show a warning message dialog.
@@ -376,6 +396,70 @@ class BaseAction(ABC):
         settings = QSettings()
         key = f"RightClickUtilities/{self.action_id}/{setting_name}"
         settings.setValue(key, value)
+        self._invalidate_settings_cache()
+    
+    def _invalidate_settings_cache(self):
+        """
+        Drop any cached settings so they are re-read on next use.
+        
+        Called whenever a setting is changed through set_setting.
+        """
+        self._settings_cache = None
+    
+    def _load_settings(self):
+        """
+        Read all schema settings in one pass over this action's settings group.
+        
+        Each value is read with the type of its schema default, so stored strings
+        such as "false" come back as real booleans and numbers.
+        
+        Returns:
+            SimpleNamespace: Settings keyed by their schema names
+        
+        Raises:
+            ValueError, TypeError: If a stored setting cannot be converted
+        """
+        from qgis.PyQt.QtCore import QSettings
+        settings = QSettings()
+        settings.beginGroup(f"RightClickUtilities/{self.action_id}")
+        try:
+            values = {
+                name: settings.value(name, setting_def['default'], type=type(setting_def['default']))
+                for name, setting_def in self.get_settings_schema().items()
+            }
+        finally:
+            settings.endGroup()
+        
+        return self._prepare_settings(values)
+    
+    def _prepare_settings(self, values):
+        """
+        Build the cached settings object from the values read from QSettings.
+        
+        Override to add values derived from the settings, so they are computed
+        once per settings change instead of on every execution.
+        
+        Args:
+            values (dict): Typed setting values keyed by their schema names
+        
+        Returns:
+            SimpleNamespace: Settings keyed by their schema names
+        """
+        return SimpleNamespace(**values)
+    
+    def _get_settings(self):
+        """
+        Get the cached settings, reading them on first use after a change.
+        
+        Returns:
+            SimpleNamespace: Settings keyed by their schema names
+        
+        Raises:
+            ValueError, TypeError: If a stored setting cannot be converted
+        """
+        if self._settings_cache is None:
+            self._settings_cache = self._load_settings()
+        return self._settings_cache
     
     def reset_settings_to_defaults(self):
         """
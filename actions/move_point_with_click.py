@@ -6,19 +6,106 @@ User clicks on the map to specify the new location for the point.
 """
 
 from .base_action import BaseAction
-from qgis.core import QgsPointXY, QgsGeometry, QgsCoordinateTransform, QgsProject, QgsFeature
+from qgis.core import QgsGeometry
 from qgis.gui import QgsMapTool
 from qgis.PyQt.QtCore import Qt
-from qgis.PyQt.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QCheckBox, QGroupBox, QMessageBox
-)
+from qgis.PyQt.QtWidgets import QDialog
+from types import SimpleNamespace, MappingProxyType
+
+
+# Settings schema is static, so build it once at import time
+_SETTINGS_SCHEMA = MappingProxyType({
+    # BEHAVIOR SETTINGS - User experience options
+    'confirm_move': {
+        'type': 'bool',
+        'default': False,
+        'label': 'Confirm Before Moving',
+        'description': 'Show confirmation dialog before moving the point',
+    },
+    'confirmation_message_template': {
+        'type': 'str',
+        'default': 'Move point feature ID {feature_id} from layer \'{layer_name}\'?',
+        'label': 'Confirmation Message Template',
+        'description': 'Template for confirmation message. Available variables: {feature_id}, {layer_name}, {geometry_type}',
+    },
+    'show_success_message': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Success Message',
+        'description': 'Display a message when point is moved successfully',
+    },
+    'success_message_template': {
+        'type': 'str',
+        'default': 'Point feature ID {feature_id} moved successfully',
+        'label': 'Success Message Template',
+        'description': 'Template for success message. Available variables: {feature_id}, {layer_name}, {distance_moved}',
+    },
+    'show_cancellation_message': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Cancellation Message',
+        'description': 'Display a message when move operation is cancelled',
+    },
+    'auto_commit_changes': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Auto-commit Changes',
+        'description': 'Automatically commit changes after moving (recommended)',
+    },
+    'handle_edit_mode_automatically': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Handle Edit Mode Automatically',
+        'description': 'Automatically enter/exit edit mode as needed',
+    },
+    'rollback_on_error': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Rollback on Error',
+        'description': 'Rollback changes if move operation fails',
+    },
+    'show_coordinate_info': {
+        'type': 'bool',
+        'default': False,
+        'label': 'Show Coordinate Info',
+        'description': 'Display coordinate information in confirmation and success messages',
+    },
+    
+    # COPY SETTINGS
+    'ask_create_copy': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Ask to Create Copy',
+        'description': 'Ask user each time if they want to create a copy instead of moving the original',
+    },
+    'default_copy_choice': {
+        'type': 'choice',
+        'default': 'ask',
+        'label': 'Default Copy Choice',
+        'description': 'Default choice when asking about creating copy. "ask" means prompt user each time, "copy" means always create copy, "move" means always move original.',
+        'options': ['ask', 'copy', 'move'],
+    },
+    'show_copy_info_in_messages': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Copy Info in Messages',
+        'description': 'Include information about copy creation in success messages',
+    },
+    
+    # DIALOG SETTINGS
+    'use_unified_dialog': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Use Unified Dialog',
+        'description': 'Combine confirmation and copy options in one dialog. If disabled, shows separate popups.',
+    },
+})
 
 
 class MovePointMapTool(QgsMapTool):
     """Custom map tool for moving point features."""
     
-    def __init__(self, canvas, parent_action, feature, layer, original_geometry):
+    def __init__(self, canvas, parent_action, feature, layer, original_geometry, settings):
         super().__init__(canvas)
         self.canvas = canvas
         self.parent_action = parent_action
@@ -30,8 +117,8 @@ class MovePointMapTool(QgsMapTool):
         # Store original point coordinates
         self.original_point = original_geometry.asPoint()
         
-        # Get settings
-        self.settings = self.parent_action.get_all_settings()
+        # Settings snapshot taken by the action when the move started
+        self.settings = settings
     
     def canvasPressEvent(self, event):
         """Handle canvas press to place point at new location."""
@@ -39,12 +126,11 @@ class MovePointMapTool(QgsMapTool):
             # Get current mouse position
             new_point = self.toMapCoordinates(event.pos())
             
-            # Create new point geometry
             new_geometry = QgsGeometry.fromPointXY(new_point)
             
             # Move the feature
             self.parent_action._move_feature_to_geometry(
-                self.feature, self.layer, new_geometry
+                self.feature, self.layer, new_geometry, new_point, self.original_point, self.settings
             )
             
             # Restore original map tool
@@ -66,7 +152,7 @@ class MovePointMapTool(QgsMapTool):
     def _cancel_move(self):
         """Cancel the move operation."""
         # Show cancellation message if enabled
-        if self.settings.get('show_cancellation_message', True):
+        if self.settings.show_cancellation_message:
             self.parent_action.show_info("Move Cancelled", "Point move operation was cancelled.")
         
         # Restore original map tool
@@ -80,6 +166,9 @@ class MoveWithClickDialog(QDialog):
     """Unified dialog for move with click actions - combines confirmation and copy option."""
     
     def __init__(self, parent=None, confirmation_message="", ask_copy=True, default_copy=False):
+        # Widget classes are only needed once the dialog is actually shown
+        from qgis.PyQt.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox, QGroupBox
+        
         super().__init__(parent)
         self.setWindowTitle("Move Feature")
         self.setModal(True)
@@ -88,22 +177,19 @@ class MoveWithClickDialog(QDialog):
         layout = QVBoxLayout()
         
         # Confirmation message
-        if confirmation_message:
-            message_label = QLabel(confirmation_message)
-            message_label.setWordWrap(True)
-            layout.addWidget(message_label)
+        self.message_label = QLabel()
+        self.message_label.setWordWrap(True)
+        layout.addWidget(self.message_label)
         
         # Copy option group
-        if ask_copy:
-            copy_group = QGroupBox("Copy Options")
-            copy_layout = QVBoxLayout()
-            
-            self.create_copy_checkbox = QCheckBox("Create a copy (original stays in place)")
-            self.create_copy_checkbox.setChecked(default_copy)
-            copy_layout.addWidget(self.create_copy_checkbox)
-            
-            copy_group.setLayout(copy_layout)
-            layout.addWidget(copy_group)
+        self.copy_group = QGroupBox("Copy Options")
+        copy_layout = QVBoxLayout()
+        
+        self.create_copy_checkbox = QCheckBox("Create a copy (original stays in place)")
+        copy_layout.addWidget(self.create_copy_checkbox)
+        
+        self.copy_group.setLayout(copy_layout)
+        layout.addWidget(self.copy_group)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -118,16 +204,43 @@ class MoveWithClickDialog(QDialog):
         layout.addLayout(button_layout)
         
         self.setLayout(layout)
+        
+        self.configure(confirmation_message, ask_copy, default_copy)
     
-    def get_create_copy(self):
-        """Get whether to create a copy."""
-        return self.create_copy_checkbox.isChecked() if hasattr(self, 'create_copy_checkbox') else False
+    def configure(self, confirmation_message="", ask_copy=True, default_copy=False):
+        """
+        Update the dialog contents so a single instance can be reused.
+        
+        Args:
+            confirmation_message (str): Message to display, hidden if empty
+            ask_copy (bool): Whether to show the copy option
+            default_copy (bool): Initial state of the copy checkbox
+        """
+        self.message_label.setText(confirmation_message)
+        self.message_label.setVisible(bool(confirmation_message))
+        self.copy_group.setVisible(ask_copy)
+        self.create_copy_checkbox.setChecked(default_copy)
+        
+        # Bind the copy lookup once instead of checking the mode on every call
+        if ask_copy:
+            self.get_create_copy = self.create_copy_checkbox.isChecked
+        else:
+            self.get_create_copy = lambda: False
 
 
 class CreateCopyDialog(QDialog):
     """Dialog to ask user if they want to create a copy instead of moving."""
     
+    # Dialog result codes; both must differ from QDialog.Rejected (0)
+    COPY_RESULT = 1
+    MOVE_RESULT = 2
+    
+    # Maps dialog result codes to get_choice() return values
+    CHOICE_BY_RESULT = {COPY_RESULT: 1, MOVE_RESULT: 0}
+    
     def __init__(self, parent=None, feature_type="feature"):
+        from qgis.PyQt.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+        
         super().__init__(parent)
         self.setWindowTitle("Create Copy?")
         self.setModal(True)
@@ -136,13 +249,9 @@ class CreateCopyDialog(QDialog):
         layout = QVBoxLayout()
         
         # Message label
-        message = QLabel(
-            f"Would you like to create a copy of this {feature_type}?\n\n"
-            "Yes: Create a copy at the new location (original stays in place)\n"
-            "No: Move the original to the new location"
-        )
-        message.setWordWrap(True)
-        layout.addWidget(message)
+        self.message_label = QLabel()
+        self.message_label.setWordWrap(True)
+        layout.addWidget(self.message_label)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -150,8 +259,8 @@ class CreateCopyDialog(QDialog):
         self.no_button = QPushButton("No, Move Original")
         self.cancel_button = QPushButton("Cancel")
         
-        self.yes_button.clicked.connect(lambda: self.done(1))  # Return 1 for copy
-        self.no_button.clicked.connect(lambda: self.done(0))   # Return 0 for move
+        self.yes_button.clicked.connect(lambda: self.done(self.COPY_RESULT))
+        self.no_button.clicked.connect(lambda: self.done(self.MOVE_RESULT))
         self.cancel_button.clicked.connect(self.reject)
         
         button_layout.addWidget(self.yes_button)
@@ -160,13 +269,25 @@ class CreateCopyDialog(QDialog):
         layout.addLayout(button_layout)
         
         self.setLayout(layout)
+        
+        self.configure(feature_type)
+    
+    def configure(self, feature_type="feature"):
+        """
+        Update the dialog message so a single instance can be reused.
+        
+        Args:
+            feature_type (str): Feature type name shown in the message
+        """
+        self.message_label.setText(
+            f"Would you like to create a copy of this {feature_type}?\n\n"
+            "Yes: Create a copy at the new location (original stays in place)\n"
+            "No: Move the original to the new location"
+        )
     
     def get_choice(self):
         """Get user choice: 1 = create copy, 0 = move original, None = cancelled."""
-        result = self.exec_()
-        if result == QDialog.Rejected:
-            return None
-        return result
+        return self.CHOICE_BY_RESULT.get(self.exec_())
 
 
 class MovePointAction(BaseAction):
@@ -190,95 +311,14 @@ class MovePointAction(BaseAction):
         # Feature type support - only works with point features
         self.set_supported_click_types(['point', 'multipoint'])
         self.set_supported_geometry_types(['point', 'multipoint'])
+        
+        # Dialogs are built on first use and reused for later clicks
+        self._move_dialog = None
+        self._copy_dialog = None
     
     def get_settings_schema(self):
         """Define the settings schema for this action."""
-        return {
-            # BEHAVIOR SETTINGS - User experience options
-            'confirm_move': {
-                'type': 'bool',
-                'default': False,
-                'label': 'Confirm Before Moving',
-                'description': 'Show confirmation dialog before moving the point',
-            },
-            'confirmation_message_template': {
-                'type': 'str',
-                'default': 'Move point feature ID {feature_id} from layer \'{layer_name}\'?',
-                'label': 'Confirmation Message Template',
-                'description': 'Template for confirmation message. Available variables: {feature_id}, {layer_name}, {geometry_type}',
-            },
-            'show_success_message': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Success Message',
-                'description': 'Display a message when point is moved successfully',
-            },
-            'success_message_template': {
-                'type': 'str',
-                'default': 'Point feature ID {feature_id} moved successfully',
-                'label': 'Success Message Template',
-                'description': 'Template for success message. Available variables: {feature_id}, {layer_name}, {distance_moved}',
-            },
-            'show_cancellation_message': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Cancellation Message',
-                'description': 'Display a message when move operation is cancelled',
-            },
-            'auto_commit_changes': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Auto-commit Changes',
-                'description': 'Automatically commit changes after moving (recommended)',
-            },
-            'handle_edit_mode_automatically': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Handle Edit Mode Automatically',
-                'description': 'Automatically enter/exit edit mode as needed',
-            },
-            'rollback_on_error': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Rollback on Error',
-                'description': 'Rollback changes if move operation fails',
-            },
-            'show_coordinate_info': {
-                'type': 'bool',
-                'default': False,
-                'label': 'Show Coordinate Info',
-                'description': 'Display coordinate information in confirmation and success messages',
-            },
-            
-            # COPY SETTINGS
-            'ask_create_copy': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Ask to Create Copy',
-                'description': 'Ask user each time if they want to create a copy instead of moving the original',
-            },
-            'default_copy_choice': {
-                'type': 'choice',
-                'default': 'ask',
-                'label': 'Default Copy Choice',
-                'description': 'Default choice when asking about creating copy. "ask" means prompt user each time, "copy" means always create copy, "move" means always move original.',
-                'options': ['ask', 'copy', 'move'],
-            },
-            'show_copy_info_in_messages': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Copy Info in Messages',
-                'description': 'Include information about copy creation in success messages',
-            },
-            
-            # DIALOG SETTINGS
-            'use_unified_dialog': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Use Unified Dialog',
-                'description': 'Combine confirmation and copy options in one dialog. If disabled, shows separate popups.',
-            },
-        }
+        return _SETTINGS_SCHEMA
     
     def execute(self, context):
         """
@@ -366,64 +406,92 @@ class MovePointAction(BaseAction):
                 default_copy = False
                 show_copy_option = True
         
+        # Resolve copy choice from settings; dialogs below may override it
+        create_copy = (default_copy_choice == 'copy')
+        
         # Use unified dialog or separate popups
-        create_copy = False
-        if use_unified_dialog and (confirm_move or show_copy_option):
+        if not confirm_move and not show_copy_option:
+            # Nothing to ask - go straight to the map tool
+            pass
+        elif use_unified_dialog:
             # Combine confirmation and copy in one dialog
-            dialog = MoveWithClickDialog(
-                None,
-                confirmation_message=confirmation_message,
-                ask_copy=show_copy_option,
-                default_copy=default_copy
-            )
+            dialog = self._get_move_dialog(confirmation_message, show_copy_option, default_copy)
             
             if dialog.exec_() != QDialog.Accepted:
                 return  # User cancelled
             
-            create_copy = dialog.get_create_copy() if show_copy_option else (default_copy_choice == 'copy')
+            if show_copy_option:
+                create_copy = dialog.get_create_copy()
         else:
             # Use separate popups (legacy behavior)
             if confirm_move:
                 if not self.confirm_action("Move Point", confirmation_message):
                     return
             
-            if ask_create_copy:
-                if default_copy_choice == 'ask':
-                    copy_dialog = CreateCopyDialog(None, "point")
-                    copy_choice = copy_dialog.get_choice()
-                    if copy_choice is None:
-                        return  # User cancelled
-                    create_copy = (copy_choice == 1)
-                elif default_copy_choice == 'copy':
-                    create_copy = True
-                else:  # default_copy_choice == 'move'
-                    create_copy = False
-            else:
-                create_copy = (default_copy_choice == 'copy')
+            if ask_create_copy and default_copy_choice == 'ask':
+                copy_dialog = self._get_copy_dialog()
+                copy_choice = copy_dialog.get_choice()
+                if copy_choice is None:
+                    return  # User cancelled
+                create_copy = (copy_choice == 1)
         
         # Store settings for the map tool
-        self._current_settings = {
-            'show_success_message': show_success,
-            'success_message_template': success_template,
-            'show_cancellation_message': show_cancellation,
-            'auto_commit_changes': auto_commit,
-            'handle_edit_mode_automatically': handle_edit_mode,
-            'rollback_on_error': rollback_on_error,
-            'show_coordinate_info': show_coordinate_info,
-            'show_copy_info': show_copy_info,
-            'create_copy': create_copy,
-            'point_coords': point_coords,
-            'feature_id': feature.id(),
-            'layer_name': layer.name(),
-            'geometry_type': detected_feature.geometry_type
-        }
+        move_settings = SimpleNamespace(
+            show_success_message=show_success,
+            success_message_template=success_template,
+            show_cancellation_message=show_cancellation,
+            auto_commit_changes=auto_commit,
+            handle_edit_mode_automatically=handle_edit_mode,
+            rollback_on_error=rollback_on_error,
+            show_coordinate_info=show_coordinate_info,
+            show_copy_info=show_copy_info,
+            create_copy=create_copy,
+            point_coords=point_coords,
+            feature_id=feature.id(),
+            layer_name=layer.name(),
+            geometry_type=detected_feature.geometry_type
+        )
         
         # Create and activate the move tool
-        move_tool = MovePointMapTool(canvas, self, feature, layer, geometry)
+        move_tool = MovePointMapTool(canvas, self, feature, layer, geometry, move_settings)
         move_tool.original_tool = canvas.mapTool()
         canvas.setMapTool(move_tool)
     
-    def _move_feature_to_geometry(self, feature, layer, new_geometry):
+    def _get_move_dialog(self, confirmation_message, ask_copy, default_copy):
+        """
+        Get the unified move dialog, creating it on first use.
+        
+        Args:
+            confirmation_message (str): Confirmation message to display
+            ask_copy (bool): Whether to show the copy option
+            default_copy (bool): Initial state of the copy checkbox
+            
+        Returns:
+            MoveWithClickDialog: Dialog configured for this invocation
+        """
+        if self._move_dialog is None:
+            self._move_dialog = MoveWithClickDialog(
+                None,
+                confirmation_message=confirmation_message,
+                ask_copy=ask_copy,
+                default_copy=default_copy
+            )
+        else:
+            self._move_dialog.configure(confirmation_message, ask_copy, default_copy)
+        return self._move_dialog
+    
+    def _get_copy_dialog(self):
+        """
+        Get the create-copy dialog, creating it on first use.
+        
+        Returns:
+            CreateCopyDialog: Dialog asking whether to copy the point
+        """
+        if self._copy_dialog is None:
+            self._copy_dialog = CreateCopyDialog(None, "point")
+        return self._copy_dialog
+    
+    def _move_feature_to_geometry(self, feature, layer, new_geometry, new_point, original_point, settings):
         """
         Move the feature to the new geometry.
         
@@ -431,30 +499,38 @@ class MovePointAction(BaseAction):
             feature: The feature to move
             layer: The layer containing the feature
             new_geometry: The new geometry for the feature
+            new_point (QgsPointXY): The new point location
+            original_point (QgsPointXY): The original point location
+            settings (SimpleNamespace): Settings snapshot taken in execute()
         """
-        settings = getattr(self, '_current_settings', {})
+        from qgis.core import QgsFeature
         
         # Handle edit mode if enabled
         edit_result = None
         was_in_edit_mode = False
         edit_mode_entered = False
         
-        if settings.get('handle_edit_mode_automatically', True):
+        if settings.handle_edit_mode_automatically:
             edit_result = self.handle_edit_mode(layer, "point move")
             if edit_result[0] is None:  # Error occurred
                 return
             was_in_edit_mode, edit_mode_entered = edit_result
         
+        # Tracks an edit command that is still open, so failures can discard it
+        edit_command_started = False
+        
         try:
             # Calculate distance moved for success message
-            original_geometry = feature.geometry()
-            original_point = original_geometry.asPoint()
-            new_point = new_geometry.asPoint()
             distance_moved = original_point.distance(new_point)
             
-            create_copy = settings.get('create_copy', False)
+            create_copy = settings.create_copy
             new_feature = None
             
+            # Record the edit as a single undo step
+            edit_command_started = layer.isEditable()
+            if edit_command_started:
+                layer.beginEditCommand("point move")
+            
             if create_copy:
                 # Create a copy of the feature with new geometry
                 new_feature = QgsFeature(feature)
@@ -463,54 +539,65 @@ class MovePointAction(BaseAction):
                 
                 # Add the new feature to the layer
                 if not layer.addFeature(new_feature):
+                    if edit_command_started:
+                        layer.destroyEditCommand()
                     self.show_error("Error", "Failed to create copy of point")
                     return
                 
                 operation_name = "point copy"
             else:
-                # Update original feature geometry
-                feature.setGeometry(new_geometry)
-                if not layer.updateFeature(feature):
-                    self.show_error("Error", "Failed to update point geometry")
-                    return
+                # Update only the geometry, falling back to a full feature update
+                if not layer.changeGeometry(feature.id(), new_geometry):
+                    feature.setGeometry(new_geometry)
+                    if not layer.updateFeature(feature):
+                        if edit_command_started:
+                            layer.destroyEditCommand()
+                        self.show_error("Error", "Failed to update point geometry")
+                        return
                 
                 operation_name = "point move"
             
+            if edit_command_started:
+                layer.endEditCommand()
+                edit_command_started = False
+            
             # Commit changes if enabled
-            if settings.get('auto_commit_changes', True) and settings.get('handle_edit_mode_automatically', True):
+            if settings.auto_commit_changes and settings.handle_edit_mode_automatically:
                 if not self.commit_changes(layer, operation_name):
                     return
             
             # Show success message if enabled
-            if settings.get('show_success_message', True):
+            if settings.show_success_message:
                 if create_copy and new_feature:
                     success_message = f"Point feature copy created successfully (ID: {new_feature.id()})"
                 else:
                     success_message = self.format_message_template(
-                        settings.get('success_message_template', 'Point feature ID {feature_id} moved successfully'),
-                        feature_id=settings.get('feature_id', feature.id()),
-                        layer_name=settings.get('layer_name', layer.name()),
+                        settings.success_message_template,
+                        feature_id=settings.feature_id,
+                        layer_name=settings.layer_name,
                         distance_moved=f"{distance_moved:.2f} map units"
                     )
                 
                 # Add coordinate info if requested
-                if settings.get('show_coordinate_info', False):
+                if settings.show_coordinate_info:
                     new_coords = f"({new_point.x():.6f}, {new_point.y():.6f})"
                     success_message += f"\n\nNew coordinates: {new_coords}"
                 
-                if settings.get('show_copy_info', True) and create_copy:
-                    success_message += f"\n\nOriginal feature (ID: {settings.get('feature_id', feature.id())}) remains at original location."
+                if settings.show_copy_info and create_copy:
+                    success_message += f"\n\nOriginal feature (ID: {settings.feature_id}) remains at original location."
                 
                 self.show_info("Success", success_message)
             
         except Exception as e:
+            if edit_command_started:
+                layer.destroyEditCommand()
             self.show_error("Error", f"Failed to move point feature: {str(e)}")
-            if settings.get('rollback_on_error', True) and settings.get('handle_edit_mode_automatically', True):
+            if settings.rollback_on_error and settings.handle_edit_mode_automatically:
                 self.rollback_changes(layer)
             
         finally:
             # Exit edit mode if we entered it
-            if settings.get('handle_edit_mode_automatically', True):
+            if settings.handle_edit_mode_automatically:
                 self.exit_edit_mode(layer, edit_mode_entered)
     
     def format_message_template(self, template, **kwargs):
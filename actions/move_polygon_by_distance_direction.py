@@ -6,13 +6,172 @@ User inputs distance in map units and direction in degrees.
 """
 
 from .base_action import BaseAction
-from qgis.core import QgsPointXY, QgsGeometry, QgsCoordinateTransform, QgsProject, QgsFeature
-from qgis.PyQt.QtWidgets import (
-    QInputDialog, QMessageBox, QDialog, QVBoxLayout, QHBoxLayout, 
-    QLabel, QPushButton, QFormLayout, QDoubleSpinBox, QCheckBox, QGroupBox
-)
+from qgis.core import QgsGeometry, QgsFeature
+from qgis.PyQt.QtWidgets import QDialog
 from qgis.PyQt.QtCore import Qt
 import math
+import re
+import string
+from types import SimpleNamespace, MappingProxyType
+
+
+# Direction inputs have 0.1° resolution, so unit offsets for every possible
+# direction in [0, 360] are precomputed as interleaved (x, y) pairs.
+# Directions are compass bearings (0° = North, 90° = East), which map to the
+# mathematical angle 90° - direction.
+_DIRECTION_STEPS_PER_DEGREE = 10
+_SINCOS = tuple(
+    (math.cos(math.radians(90.0 - i / _DIRECTION_STEPS_PER_DEGREE)),
+     math.sin(math.radians(90.0 - i / _DIRECTION_STEPS_PER_DEGREE)))
+    for i in range(360 * _DIRECTION_STEPS_PER_DEGREE + 1)
+)
+
+# Exact offsets for cardinal directions, avoiding tiny trig rounding errors
+# such as cos(90°) != 0 that would otherwise drift into the moved vertices
+_CARDINAL_OFFSETS = {
+    0.0: (0.0, 1.0),
+    90.0: (1.0, 0.0),
+    180.0: (0.0, -1.0),
+    270.0: (-1.0, 0.0),
+    360.0: (0.0, 1.0),
+}
+
+
+def _direction_to_unit_offset(direction):
+    """
+    Convert a compass direction to a unit (x, y) offset.
+    
+    Args:
+        direction (float): Direction in degrees (0° = North, 90° = East)
+    
+    Returns:
+        tuple: (x, y) components of a unit vector pointing in that direction
+    """
+    cardinal_offset = _CARDINAL_OFFSETS.get(direction)
+    if cardinal_offset is not None:
+        return cardinal_offset
+    
+    index = round(direction * _DIRECTION_STEPS_PER_DEGREE)
+    if 0 <= index < len(_SINCOS) and index == direction * _DIRECTION_STEPS_PER_DEGREE:
+        return _SINCOS[index]
+    
+    # Directions off the 0.1° grid fall back to direct computation
+    direction_rad = math.radians(90.0 - direction)
+    return math.cos(direction_rad), math.sin(direction_rad)
+
+
+def _compile_message_template(template):
+    """
+    Compile a {variable} message template into a string.Template.
+    
+    Args:
+        template (str): Message template with {variable} placeholders
+    
+    Returns:
+        string.Template: Template whose safe_substitute leaves unknown variables as-is
+    """
+    return string.Template(re.sub(r'\{(\w+)\}', r'${\1}', template))
+
+
+# Settings schema is static, so build it once at import time
+_SETTINGS_SCHEMA = MappingProxyType({
+    # BEHAVIOR SETTINGS - User experience options
+    'confirm_move': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Confirm Before Moving',
+        'description': 'Show confirmation dialog before moving the polygon',
+    },
+    'confirmation_message_template': {
+        'type': 'str',
+        'default': 'Move polygon feature ID {feature_id} from layer \'{layer_name}\' by {distance} units at {direction}°?',
+        'label': 'Confirmation Message Template',
+        'description': 'Template for confirmation message. Available variables: {feature_id}, {layer_name}, {distance}, {direction}',
+    },
+    'show_success_message': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Success Message',
+        'description': 'Display a message when polygon is moved successfully',
+    },
+    'success_message_template': {
+        'type': 'str',
+        'default': 'Polygon feature ID {feature_id} moved successfully by {distance} units at {direction}°',
+        'label': 'Success Message Template',
+        'description': 'Template for success message. Available variables: {feature_id}, {layer_name}, {distance}, {direction}',
+    },
+    'auto_commit_changes': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Auto-commit Changes',
+        'description': 'Automatically commit changes after moving (recommended)',
+    },
+    'handle_edit_mode_automatically': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Handle Edit Mode Automatically',
+        'description': 'Automatically enter/exit edit mode as needed',
+    },
+    'rollback_on_error': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Rollback on Error',
+        'description': 'Rollback changes if move operation fails',
+    },
+    'show_polygon_area_info': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Polygon Area Info',
+        'description': 'Display polygon area information in confirmation and success messages',
+    },
+    'default_distance': {
+        'type': 'float',
+        'default': 100.0,
+        'label': 'Default Distance',
+        'description': 'Default distance value for the input dialog',
+        'min': 0.0,
+        'max': 1000000.0,
+        'step': 1.0,
+    },
+    'default_direction': {
+        'type': 'float',
+        'default': 0.0,
+        'label': 'Default Direction',
+        'description': 'Default direction value for the input dialog (degrees)',
+        'min': 0.0,
+        'max': 360.0,
+        'step': 1.0,
+    },
+    
+    # COPY SETTINGS
+    'ask_create_copy': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Ask to Create Copy',
+        'description': 'Ask user each time if they want to create a copy instead of moving the original',
+    },
+    'default_copy_choice': {
+        'type': 'choice',
+        'default': 'ask',
+        'label': 'Default Copy Choice',
+        'description': 'Default choice when asking about creating copy. "ask" means prompt user each time, "copy" means always create copy, "move" means always move original.',
+        'options': ['ask', 'copy', 'move'],
+    },
+    'show_copy_info_in_messages': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Copy Info in Messages',
+        'description': 'Include information about copy creation in success messages',
+    },
+    
+    # DIALOG SETTINGS
+    'use_unified_dialog': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Use Unified Dialog',
+        'description': 'Use a single dialog for all inputs (distance, direction, copy). If disabled, shows separate popups for each input.',
+    },
+})
 
 
 class MoveByDistanceDirectionDialog(QDialog):
@@ -20,6 +179,12 @@ class MoveByDistanceDirectionDialog(QDialog):
     
     def __init__(self, parent=None, default_distance=100.0, default_direction=0.0, 
                  polygon_area=None, ask_copy=True, default_copy=False):
+        # Widget classes are only needed once the dialog is actually shown
+        from qgis.PyQt.QtWidgets import (
+            QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFormLayout,
+            QDoubleSpinBox, QCheckBox, QGroupBox
+        )
+        
         super().__init__(parent)
         self.setWindowTitle("Move by Distance & Direction")
         self.setModal(True)
@@ -29,15 +194,13 @@ class MoveByDistanceDirectionDialog(QDialog):
         form_layout = QFormLayout()
         
         # Polygon area info
-        if polygon_area is not None:
-            area_label = QLabel(f"Polygon area: {polygon_area:.2f} square map units")
-            area_label.setStyleSheet("color: gray; font-size: 10px;")
-            form_layout.addRow("", area_label)
+        self.area_label = QLabel()
+        self.area_label.setStyleSheet("color: gray; font-size: 10px;")
+        form_layout.addRow("", self.area_label)
         
         # Distance input
         self.distance_spinbox = QDoubleSpinBox()
         self.distance_spinbox.setRange(0.0, 1000000.0)
-        self.distance_spinbox.setValue(default_distance)
         self.distance_spinbox.setSuffix(" units")
         self.distance_spinbox.setDecimals(2)
         form_layout.addRow("Distance:", self.distance_spinbox)
@@ -45,7 +208,6 @@ class MoveByDistanceDirectionDialog(QDialog):
         # Direction input
         self.direction_spinbox = QDoubleSpinBox()
         self.direction_spinbox.setRange(0.0, 360.0)
-        self.direction_spinbox.setValue(default_direction)
         self.direction_spinbox.setSuffix("°")
         self.direction_spinbox.setDecimals(1)
         form_layout.addRow("Direction:", self.direction_spinbox)
@@ -58,16 +220,14 @@ class MoveByDistanceDirectionDialog(QDialog):
         layout.addLayout(form_layout)
         
         # Copy option group
-        if ask_copy:
-            copy_group = QGroupBox("Copy Options")
-            copy_layout = QVBoxLayout()
-            
-            self.create_copy_checkbox = QCheckBox("Create a copy (original stays in place)")
-            self.create_copy_checkbox.setChecked(default_copy)
-            copy_layout.addWidget(self.create_copy_checkbox)
-            
-            copy_group.setLayout(copy_layout)
-            layout.addWidget(copy_group)
+        self.copy_group = QGroupBox("Copy Options")
+        copy_layout = QVBoxLayout()
+        
+        self.create_copy_checkbox = QCheckBox("Create a copy (original stays in place)")
+        copy_layout.addWidget(self.create_copy_checkbox)
+        
+        self.copy_group.setLayout(copy_layout)
+        layout.addWidget(self.copy_group)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -83,6 +243,31 @@ class MoveByDistanceDirectionDialog(QDialog):
         
         self.setLayout(layout)
         
+        self.configure(default_distance, default_direction, polygon_area, ask_copy, default_copy)
+    
+    def configure(self, default_distance=100.0, default_direction=0.0,
+                  polygon_area=None, ask_copy=True, default_copy=False):
+        """
+        Reset the dialog inputs so a single instance can be reused.
+        
+        Args:
+            default_distance (float): Initial distance value
+            default_direction (float): Initial direction value in degrees
+            polygon_area (float): Polygon area to display, hidden if None
+            ask_copy (bool): Whether to show the copy option
+            default_copy (bool): Initial state of the copy checkbox
+        """
+        if polygon_area is not None:
+            self.area_label.setText(f"Polygon area: {polygon_area:.2f} square map units")
+        self.area_label.setVisible(polygon_area is not None)
+        
+        self.distance_spinbox.setValue(default_distance)
+        self.direction_spinbox.setValue(default_direction)
+        
+        self.ask_copy = ask_copy
+        self.copy_group.setVisible(ask_copy)
+        self.create_copy_checkbox.setChecked(default_copy)
+        
         # Set focus to distance input
         self.distance_spinbox.setFocus()
         self.distance_spinbox.selectAll()
@@ -92,14 +277,23 @@ class MoveByDistanceDirectionDialog(QDialog):
         return {
             'distance': self.distance_spinbox.value(),
             'direction': self.direction_spinbox.value(),
-            'create_copy': self.create_copy_checkbox.isChecked() if hasattr(self, 'create_copy_checkbox') else False
+            'create_copy': self.create_copy_checkbox.isChecked() if self.ask_copy else False
         }
 
 
 class CreateCopyDialog(QDialog):
     """Dialog to ask user if they want to create a copy instead of moving."""
     
+    # Dialog result codes; both must differ from QDialog.Rejected (0)
+    COPY_RESULT = 1
+    MOVE_RESULT = 2
+    
+    # Maps dialog result codes to get_choice() return values
+    CHOICE_BY_RESULT = {COPY_RESULT: 1, MOVE_RESULT: 0}
+    
     def __init__(self, parent=None, feature_type="feature"):
+        from qgis.PyQt.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+        
         super().__init__(parent)
         self.setWindowTitle("Create Copy?")
         self.setModal(True)
@@ -122,8 +316,8 @@ class CreateCopyDialog(QDialog):
         self.no_button = QPushButton("No, Move Original")
         self.cancel_button = QPushButton("Cancel")
         
-        self.yes_button.clicked.connect(lambda: self.done(1))  # Return 1 for copy
-        self.no_button.clicked.connect(lambda: self.done(0))   # Return 0 for move
+        self.yes_button.clicked.connect(lambda: self.done(self.COPY_RESULT))
+        self.no_button.clicked.connect(lambda: self.done(self.MOVE_RESULT))
         self.cancel_button.clicked.connect(self.reject)
         
         button_layout.addWidget(self.yes_button)
@@ -135,10 +329,7 @@ class CreateCopyDialog(QDialog):
     
     def get_choice(self):
         """Get user choice: 1 = create copy, 0 = move original, None = cancelled."""
-        result = self.exec_()
-        if result == QDialog.Rejected:
-            return None
-        return result
+        return self.CHOICE_BY_RESULT.get(self.exec_())
 
 
 class MovePolygonByDistanceDirectionAction(BaseAction):
@@ -162,107 +353,28 @@ class MovePolygonByDistanceDirectionAction(BaseAction):
         # Feature type support - only works with polygon features
         self.set_supported_click_types(['polygon', 'multipolygon'])
         self.set_supported_geometry_types(['polygon', 'multipolygon'])
+        
+        # Dialogs are built on first use and reused for later invocations
+        self._dialog = None
+        self._copy_dialog = None
     
     def get_settings_schema(self):
         """Define the settings schema for this action."""
-        return {
-            # BEHAVIOR SETTINGS - User experience options
-            'confirm_move': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Confirm Before Moving',
-                'description': 'Show confirmation dialog before moving the polygon',
-            },
-            'confirmation_message_template': {
-                'type': 'str',
-                'default': 'Move polygon feature ID {feature_id} from layer \'{layer_name}\' by {distance} units at {direction}°?',
-                'label': 'Confirmation Message Template',
-                'description': 'Template for confirmation message. Available variables: {feature_id}, {layer_name}, {distance}, {direction}',
-            },
-            'show_success_message': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Success Message',
-                'description': 'Display a message when polygon is moved successfully',
-            },
-            'success_message_template': {
-                'type': 'str',
-                'default': 'Polygon feature ID {feature_id} moved successfully by {distance} units at {direction}°',
-                'label': 'Success Message Template',
-                'description': 'Template for success message. Available variables: {feature_id}, {layer_name}, {distance}, {direction}',
-            },
-            'auto_commit_changes': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Auto-commit Changes',
-                'description': 'Automatically commit changes after moving (recommended)',
-            },
-            'handle_edit_mode_automatically': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Handle Edit Mode Automatically',
-                'description': 'Automatically enter/exit edit mode as needed',
-            },
-            'rollback_on_error': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Rollback on Error',
-                'description': 'Rollback changes if move operation fails',
-            },
-            'show_polygon_area_info': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Polygon Area Info',
-                'description': 'Display polygon area information in confirmation and success messages',
-            },
-            'default_distance': {
-                'type': 'float',
-                'default': 100.0,
-                'label': 'Default Distance',
-                'description': 'Default distance value for the input dialog',
-                'min': 0.0,
-                'max': 1000000.0,
-                'step': 1.0,
-            },
-            'default_direction': {
-                'type': 'float',
-                'default': 0.0,
-                'label': 'Default Direction',
-                'description': 'Default direction value for the input dialog (degrees)',
-                'min': 0.0,
-                'max': 360.0,
-                'step': 1.0,
-            },
-            
-            # COPY SETTINGS
-            'ask_create_copy': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Ask to Create Copy',
-                'description': 'Ask user each time if they want to create a copy instead of moving the original',
-            },
-            'default_copy_choice': {
-                'type': 'choice',
-                'default': 'ask',
-                'label': 'Default Copy Choice',
-                'description': 'Default choice when asking about creating copy. "ask" means prompt user each time, "copy" means always create copy, "move" means always move original.',
-                'options': ['ask', 'copy', 'move'],
-            },
-            'show_copy_info_in_messages': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Copy Info in Messages',
-                'description': 'Include information about copy creation in success messages',
-            },
-            
-            # DIALOG SETTINGS
-            'use_unified_dialog': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Use Unified Dialog',
-                'description': 'Use a single dialog for all inputs (distance, direction, copy). If disabled, shows separate popups for each input.',
-            },
-        }
+        return _SETTINGS_SCHEMA
+    
+    def _prepare_settings(self, values):
+        """
+        Build the cached settings, compiling the message templates once per settings change.
+        
+        Args:
+            values (dict): Typed setting values keyed by their schema names
+        
+        Returns:
+            SimpleNamespace: Settings keyed by their schema names, with compiled templates
+        """
+        values['confirmation_message_template'] = _compile_message_template(values['confirmation_message_template'])
+        values['success_message_template'] = _compile_message_template(values['success_message_template'])
+        return SimpleNamespace(**values)
     
     def execute(self, context):
         """
@@ -273,20 +385,7 @@ class MovePolygonByDistanceDirectionAction(BaseAction):
         """
         # Get settings with proper type conversion
         try:
-            confirm_move = bool(self.get_setting('confirm_move', True))
-            confirmation_template = str(self.get_setting('confirmation_message_template', 'Move polygon feature ID {feature_id} from layer \'{layer_name}\' by {distance} units at {direction}°?'))
-            show_success = bool(self.get_setting('show_success_message', True))
-            success_template = str(self.get_setting('success_message_template', 'Polygon feature ID {feature_id} moved successfully by {distance} units at {direction}°'))
-            auto_commit = bool(self.get_setting('auto_commit_changes', True))
-            handle_edit_mode = bool(self.get_setting('handle_edit_mode_automatically', True))
-            rollback_on_error = bool(self.get_setting('rollback_on_error', True))
-            show_polygon_area = bool(self.get_setting('show_polygon_area_info', True))
-            default_distance = float(self.get_setting('default_distance', 100.0))
-            default_direction = float(self.get_setting('default_direction', 0.0))
-            ask_create_copy = bool(self.get_setting('ask_create_copy', True))
-            default_copy_choice = str(self.get_setting('default_copy_choice', 'ask'))
-            show_copy_info = bool(self.get_setting('show_copy_info_in_messages', True))
-            use_unified_dialog = bool(self.get_setting('use_unified_dialog', True))
+            settings = self._get_settings()
         except (ValueError, TypeError) as e:
             self.show_error("Error", f"Invalid setting values: {str(e)}")
             return
@@ -309,37 +408,43 @@ class MovePolygonByDistanceDirectionAction(BaseAction):
             self.show_error("Error", "Feature has no valid geometry")
             return
         
-        # Calculate polygon area if requested
-        polygon_area = None
-        if show_polygon_area:
-            try:
-                polygon_area = geometry.area()
-            except Exception:
-                pass
+        # Calculate polygon area if requested, at most once and only where displayed
+        area_cache = []
+        
+        def get_area():
+            """Return the polygon area, or None if disabled or unavailable."""
+            if not area_cache:
+                polygon_area = None
+                if settings.show_polygon_area_info:
+                    try:
+                        polygon_area = geometry.area()
+                    except Exception:
+                        pass
+                area_cache.append(polygon_area)
+            return area_cache[0]
         
         # Get user input - use unified dialog or separate popups
-        if use_unified_dialog:
+        if settings.use_unified_dialog:
             # Determine default copy choice
             default_copy = False
             show_copy_option = False
-            if ask_create_copy:
-                if default_copy_choice == 'copy':
+            if settings.ask_create_copy:
+                if settings.default_copy_choice == 'copy':
                     default_copy = True
                     show_copy_option = True
-                elif default_copy_choice == 'move':
+                elif settings.default_copy_choice == 'move':
                     default_copy = False
                     show_copy_option = True
                 else:  # 'ask'
                     default_copy = False
                     show_copy_option = True
             
-            dialog = MoveByDistanceDirectionDialog(
-                None,
-                default_distance=default_distance,
-                default_direction=default_direction,
-                polygon_area=polygon_area,
-                ask_copy=show_copy_option,
-                default_copy=default_copy
+            dialog = self._get_dialog(
+                settings.default_distance,
+                settings.default_direction,
+                get_area(),
+                show_copy_option,
+                default_copy
             )
             
             if dialog.exec_() != QDialog.Accepted:
@@ -348,14 +453,17 @@ class MovePolygonByDistanceDirectionAction(BaseAction):
             values = dialog.get_values()
             distance = values['distance']
             direction = values['direction']
-            create_copy = values['create_copy'] if show_copy_option else (default_copy_choice == 'copy')
+            create_copy = values['create_copy'] if show_copy_option else (settings.default_copy_choice == 'copy')
         else:
             # Use separate popups (legacy behavior)
+            from qgis.PyQt.QtWidgets import QInputDialog
+            
+            polygon_area = get_area()
             distance, ok1 = QInputDialog.getDouble(
                 None, 
                 "Move Polygon by Distance & Direction", 
                 f"Enter distance to move (map units):\nPolygon area: {polygon_area:.2f} square map units" if polygon_area else "Enter distance to move (map units):",
-                default_distance, 
+                settings.default_distance, 
                 0.0, 
                 1000000.0, 
                 2
@@ -368,7 +476,7 @@ class MovePolygonByDistanceDirectionAction(BaseAction):
                 None, 
                 "Move Polygon by Distance & Direction", 
                 "Enter direction in degrees (0° = North, 90° = East, 180° = South, 270° = West):",
-                default_direction, 
+                settings.default_direction, 
                 0.0, 
                 360.0, 
             1
@@ -381,76 +489,102 @@ class MovePolygonByDistanceDirectionAction(BaseAction):
         
         # Calculate offset
         try:
-            # Convert direction from degrees to radians
             # QGIS uses mathematical convention: 0° = East, 90° = North
             # User expects: 0° = North, 90° = East
-            # So we need to convert: math_angle = 90° - user_angle
-            direction_rad = math.radians(90.0 - direction)
+            unit_x, unit_y = _direction_to_unit_offset(direction)
             
             # Calculate offset
-            offset_x = distance * math.cos(direction_rad)
-            offset_y = distance * math.sin(direction_rad)
+            offset_x = distance * unit_x
+            offset_y = distance * unit_y
             
         except Exception as e:
             self.show_error("Error", f"Failed to calculate offset: {str(e)}")
             return
         
+        def format_context():
+            """Build message template variables; only called when a message is shown."""
+            return {
+                'feature_id': feature.id(),
+                'layer_name': layer.name(),
+                'distance': f"{distance:.2f}",
+                'direction': f"{direction:.1f}",
+            }
+        
         # Ask for user confirmation before moving if enabled
-        if confirm_move:
+        if settings.confirm_move:
             # Prepare confirmation message
-            confirmation_message = self.format_message_template(
-                confirmation_template,
-                feature_id=feature.id(),
-                layer_name=layer.name(),
-                distance=f"{distance:.2f}",
-                direction=f"{direction:.1f}"
+            confirmation_message = settings.confirmation_message_template.safe_substitute(
+                format_context()
             )
             
             # Add polygon area info if requested
-            if show_polygon_area and polygon_area is not None:
+            polygon_area = get_area()
+            if polygon_area is not None:
                 confirmation_message += f"\n\nPolygon area: {polygon_area:.2f} square map units"
             
             if not self.confirm_action("Move Polygon by Distance & Direction", confirmation_message):
                 return
         
         # Handle copy choice if not already set by unified dialog
-        if not use_unified_dialog:
-            if ask_create_copy:
-                if default_copy_choice == 'ask':
-                    copy_dialog = CreateCopyDialog(None, "polygon")
+        if not settings.use_unified_dialog:
+            if settings.ask_create_copy:
+                if settings.default_copy_choice == 'ask':
+                    if self._copy_dialog is None:
+                        self._copy_dialog = CreateCopyDialog(None, "polygon")
+                    copy_dialog = self._copy_dialog
                     copy_choice = copy_dialog.get_choice()
                     if copy_choice is None:
                         return  # User cancelled
                     create_copy = (copy_choice == 1)
-                elif default_copy_choice == 'copy':
+                elif settings.default_copy_choice == 'copy':
                     create_copy = True
                 else:  # default_copy_choice == 'move'
                     create_copy = False
             else:
                 # If not asking, use default choice
-                create_copy = (default_copy_choice == 'copy')
-        
-        # Store settings for the move operation
-        self._current_settings = {
-            'show_success_message': show_success,
-            'success_message_template': success_template,
-            'auto_commit_changes': auto_commit,
-            'handle_edit_mode_automatically': handle_edit_mode,
-            'rollback_on_error': rollback_on_error,
-            'show_polygon_area_info': show_polygon_area,
-            'show_copy_info': show_copy_info,
-            'create_copy': create_copy,
-            'polygon_area': polygon_area,
-            'feature_id': feature.id(),
-            'layer_name': layer.name(),
-            'distance': f"{distance:.2f}",
-            'direction': f"{direction:.1f}"
-        }
+                create_copy = (settings.default_copy_choice == 'copy')
+        
+        # A zero-offset move would only toggle edit mode and commit an unchanged feature;
+        # a zero-offset copy still duplicates the feature in place
+        if offset_x == 0.0 and offset_y == 0.0 and not create_copy:
+            self.show_info("Nothing to Move", "Distance is zero; nothing to move.")
+            return
         
         # Move the feature
-        self._move_feature_by_offset(feature, layer, geometry, offset_x, offset_y)
+        self._move_feature_by_offset(
+            feature, layer, geometry, offset_x, offset_y,
+            create_copy, get_area, format_context
+        )
     
-    def _move_feature_by_offset(self, feature, layer, original_geometry, offset_x, offset_y):
+    def _get_dialog(self, default_distance, default_direction, polygon_area, ask_copy, default_copy):
+        """
+        Get the input dialog, creating it on first use.
+        
+        Args:
+            default_distance (float): Initial distance value
+            default_direction (float): Initial direction value in degrees
+            polygon_area (float): Polygon area to display, or None
+            ask_copy (bool): Whether to show the copy option
+            default_copy (bool): Initial state of the copy checkbox
+        
+        Returns:
+            MoveByDistanceDirectionDialog: Dialog configured for this invocation
+        """
+        if self._dialog is None:
+            self._dialog = MoveByDistanceDirectionDialog(
+                None,
+                default_distance=default_distance,
+                default_direction=default_direction,
+                polygon_area=polygon_area,
+                ask_copy=ask_copy,
+                default_copy=default_copy
+            )
+        else:
+            self._dialog.configure(default_distance, default_direction, polygon_area, ask_copy, default_copy)
+        return self._dialog
+    
+    def _move_feature_by_offset(self, feature, layer, original_geometry, offset_x, offset_y,
+                                create_copy, get_area, format_context):
         """
         Move the feature by the specified offset.
         
@@ -460,32 +594,38 @@ class MovePolygonByDistanceDirectionAction(BaseAction):
             original_geometry: The original geometry
             offset_x: X offset in map units
             offset_y: Y offset in map units
+            create_copy (bool): Whether to add a moved copy instead of moving the original
+            get_area (callable): Returns the polygon area for messages, or None
+            format_context (callable): Returns message template variables
         """
-        settings = getattr(self, '_current_settings', {})
+        settings = self._get_settings()
         
         # Handle edit mode if enabled
         edit_result = None
         was_in_edit_mode = False
         edit_mode_entered = False
         
-        if settings.get('handle_edit_mode_automatically', True):
+        if settings.handle_edit_mode_automatically:
             edit_result = self.handle_edit_mode(layer, "polygon move")
             if edit_result[0] is None:  # Error occurred
                 return
             was_in_edit_mode, edit_mode_entered = edit_result
         
         try:
-            # Create new geometry by translating the original
-            new_geometry = QgsGeometry(original_geometry)
-            new_geometry.translate(offset_x, offset_y)
-            
-            create_copy = settings.get('create_copy', False)
+            # translate() shifts every vertex in C++ in a single call, which is
+            # already faster than extracting coordinates into Python/NumPy and
+            # rebuilding the geometry, even for very large multipolygons.
             new_feature = None
             
             if create_copy:
-                # Create a copy of the feature with new geometry
-                new_feature = QgsFeature(feature)
-                new_feature.setId(-1)  # Let QGIS assign new ID
+                # Translate a copy so the original geometry is preserved
+                new_geometry = QgsGeometry(original_geometry)
+                new_geometry.translate(offset_x, offset_y)
+                
+                # Create a copy of the feature with new geometry, copying only
+                # the attributes since the original geometry is replaced anyway
+                new_feature = QgsFeature(layer.fields())  # New ID is assigned by QGIS
+                new_feature.setAttributes(feature.attributes())
                 new_feature.setGeometry(new_geometry)
                 
                 # Add the new feature to the layer
@@ -495,6 +635,11 @@ class MovePolygonByDistanceDirectionAction(BaseAction):
                 
                 operation_name = "polygon copy"
             else:
+                # feature.geometry() already returned our own copy, so it can
+                # be translated in place without another copy
+                new_geometry = original_geometry
+                new_geometry.translate(offset_x, offset_y)
+                
                 # Update original feature geometry
                 feature.setGeometry(new_geometry)
                 if not layer.updateFeature(feature):
@@ -504,59 +649,40 @@ class MovePolygonByDistanceDirectionAction(BaseAction):
                 operation_name = "polygon move"
             
             # Commit changes if enabled
-            if settings.get('auto_commit_changes', True) and settings.get('handle_edit_mode_automatically', True):
+            if settings.auto_commit_changes and settings.handle_edit_mode_automatically:
                 if not self.commit_changes(layer, operation_name):
                     return
             
             # Show success message if enabled
-            if settings.get('show_success_message', True):
+            if settings.show_success_message:
+                message_context = format_context()
                 if create_copy and new_feature:
                     success_message = f"Polygon feature copy created successfully (ID: {new_feature.id()})"
-                    success_message += f"\n\nMoved by {settings.get('distance', '0.00')} units at {settings.get('direction', '0.0')}°"
+                    success_message += f"\n\nMoved by {message_context['distance']} units at {message_context['direction']}°"
                 else:
-                    success_message = self.format_message_template(
-                        settings.get('success_message_template', 'Polygon feature ID {feature_id} moved successfully by {distance} units at {direction}°'),
-                        feature_id=settings.get('feature_id', feature.id()),
-                        layer_name=settings.get('layer_name', layer.name()),
-                        distance=settings.get('distance', '0.00'),
-                        direction=settings.get('direction', '0.0')
+                    success_message = settings.success_message_template.safe_substitute(
+                        message_context
                     )
                 
                 # Add polygon area info if requested
-                if settings.get('show_polygon_area_info', False) and settings.get('polygon_area') is not None:
-                    success_message += f"\n\nPolygon area: {settings.get('polygon_area'):.2f} square map units"
+                polygon_area = get_area()
+                if polygon_area is not None:
+                    success_message += f"\n\nPolygon area: {polygon_area:.2f} square map units"
                 
-                if settings.get('show_copy_info', True) and create_copy:
-                    success_message += f"\n\nOriginal feature (ID: {settings.get('feature_id', feature.id())}) remains at original location."
+                if settings.show_copy_info_in_messages and create_copy:
+                    success_message += f"\n\nOriginal feature (ID: {message_context['feature_id']}) remains at original location."
                 
                 self.show_info("Success", success_message)
             
         except Exception as e:
             self.show_error("Error", f"Failed to move polygon feature: {str(e)}")
-            if settings.get('rollback_on_error', True) and settings.get('handle_edit_mode_automatically', True):
+            if settings.rollback_on_error and settings.handle_edit_mode_automatically:
                 self.rollback_changes(layer)
             
         finally:
             # Exit edit mode if we entered it
-            if settings.get('handle_edit_mode_automatically', True):
+            if settings.handle_edit_mode_automatically:
                 self.exit_edit_mode(layer, edit_mode_entered)
     
-    def format_message_template(self, template, **kwargs):
-        """
-        Format a message template with provided variables.
-        
-        Args:
-            template (str): Message template with {variable} placeholders
-            **kwargs: Variables to substitute in the template
-            
-        Returns:
-            str: Formatted message
-        """
-        try:
-            return template.format(**kwargs)
-        except KeyError as e:
-            # If a variable is missing, return the template as-is
-            return template
-    
 # REQUIRED: Create global instance for automatic discovery
 move_polygon_by_distance_direction_action = MovePolygonByDistanceDirectionAction()
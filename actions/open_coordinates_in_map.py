@@ -6,8 +6,105 @@ Works universally on any click location, transforming coordinates to WGS84 for m
 """
 
 from .base_action import BaseAction
-import webbrowser
+from functools import lru_cache
 from qgis.core import QgsCoordinateReferenceSystem, QgsCoordinateTransform, QgsProject
+from qgis.PyQt.QtCore import QSettings
+from types import MappingProxyType, SimpleNamespace
+
+
+# URL templates per map service, filled with lat, lon and zoom
+_MAP_URL_TEMPLATES = {
+    'Google Maps': "https://www.google.com/maps?q={lat},{lon}&z={zoom}",
+    'OpenStreetMap': "https://www.openstreetmap.org/?mlat={lat}&mlon={lon}&zoom={zoom}",
+    'Bing Maps': "https://www.bing.com/maps?cp={lat}~{lon}&lvl={zoom}",
+    # Mapbox URL format (note: may require API key for full functionality)
+    'Mapbox': "https://www.mapbox.com/maps?lat={lat}&lon={lon}&zoom={zoom}",
+    'Yandex Maps': "https://yandex.com/maps/?pt={lon},{lat}&z={zoom}",
+    'Apple Maps': "https://maps.apple.com/?ll={lat},{lon}&z={zoom}",
+    'Here WeGo': "https://wego.here.com/?map={lat},{lon},{zoom},normal",
+    'Baidu Maps': "https://map.baidu.com/?newmap=1&ie=utf-8&s=s%26wd%3D{lat}%2C{lon}",
+}
+_DEFAULT_MAP_SERVICE = 'Google Maps'
+
+# Message shown before opening the map
+_COORD_MESSAGE_TEMPLATE = "Opening coordinates in {service}:\n\nLatitude: {lat:.6f}\nLongitude: {lon:.6f}\nZoom Level: {zoom}"
+
+
+@lru_cache(maxsize=1)
+def _get_wgs84_crs():
+    """
+    Get the target CRS for all map services, built on first use.
+    
+    Canvases already in WGS84 never need it, so it is not created at import time.
+    
+    Returns:
+        QgsCoordinateReferenceSystem: The EPSG:4326 CRS
+    """
+    return QgsCoordinateReferenceSystem("EPSG:4326")
+
+
+@lru_cache(maxsize=64)
+def _get_wgs84_transform(source_authid):
+    """
+    Get a cached transform from the given CRS to WGS84.
+    
+    Building a QgsCoordinateTransform is expensive, so one is kept per source CRS.
+    Each transform captures the project's transform context, so the cache is
+    cleared whenever that context changes (see OpenCoordinatesInMapAction).
+    
+    Args:
+        source_authid (str): Authority identifier of the source CRS (e.g. 'EPSG:3857')
+    
+    Returns:
+        QgsCoordinateTransform: Transform from the source CRS to WGS84
+    """
+    source_crs = QgsCoordinateReferenceSystem(source_authid)
+    return QgsCoordinateTransform(source_crs, _get_wgs84_crs(), QgsProject.instance())
+
+
+# Settings schema is static, so build it once at import time
+_SETTINGS_SCHEMA = MappingProxyType({
+    # MAP SERVICE SETTINGS - Easy to customize map service
+    'map_service': {
+        'type': 'choice',
+        'default': 'Google Maps',
+        'label': 'Map Service',
+        'description': 'Web map service to use for opening coordinates',
+        'options': [
+            'Google Maps',
+            'OpenStreetMap',
+            'Bing Maps',
+            'Mapbox',
+            'Yandex Maps',
+            'Apple Maps',
+            'Here WeGo',
+            'Baidu Maps'
+        ],
+    },
+    'zoom_level': {
+        'type': 'int',
+        'default': 15,
+        'label': 'Default Zoom Level',
+        'description': 'Default zoom level for map (1-20, where 1 is world view and 20 is street level)',
+        'min': 1,
+        'max': 20,
+        'step': 1,
+    },
+    
+    # BEHAVIOR SETTINGS - User experience options
+    'show_coordinates': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Coordinates',
+        'description': 'Display the coordinates that will be opened in a message before opening',
+    },
+    'show_success_message': {
+        'type': 'bool',
+        'default': False,
+        'label': 'Show Success Message',
+        'description': 'Display a success message after opening the map',
+    },
+})
 
 
 class OpenCoordinatesInMapAction(BaseAction):
@@ -31,51 +128,14 @@ class OpenCoordinatesInMapAction(BaseAction):
         # Feature type support - works everywhere
         self.set_supported_click_types(['universal'])
         self.set_supported_geometry_types(['point', 'multipoint', 'line', 'multiline', 'polygon', 'multipolygon', 'canvas'])
+        
+        # Cached transforms hold the project transform context, so drop them when it changes
+        # (datum transform edits, project loads and project clears all emit this signal)
+        QgsProject.instance().transformContextChanged.connect(_get_wgs84_transform.cache_clear)
     
     def get_settings_schema(self):
         """Define the settings schema for this action."""
-        return {
-            # MAP SERVICE SETTINGS - Easy to customize map service
-            'map_service': {
-                'type': 'choice',
-                'default': 'Google Maps',
-                'label': 'Map Service',
-                'description': 'Web map service to use for opening coordinates',
-                'options': [
-                    'Google Maps',
-                    'OpenStreetMap',
-                    'Bing Maps',
-                    'Mapbox',
-                    'Yandex Maps',
-                    'Apple Maps',
-                    'Here WeGo',
-                    'Baidu Maps'
-                ],
-            },
-            'zoom_level': {
-                'type': 'int',
-                'default': 15,
-                'label': 'Default Zoom Level',
-                'description': 'Default zoom level for map (1-20, where 1 is world view and 20 is street level)',
-                'min': 1,
-                'max': 20,
-                'step': 1,
-            },
-            
-            # BEHAVIOR SETTINGS - User experience options
-            'show_coordinates': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Coordinates',
-                'description': 'Display the coordinates that will be opened in a message before opening',
-            },
-            'show_success_message': {
-                'type': 'bool',
-                'default': False,
-                'label': 'Show Success Message',
-                'description': 'Display a success message after opening the map',
-            },
-        }
+        return _SETTINGS_SCHEMA
     
     def get_setting(self, setting_name, default_value=None):
         """
@@ -88,58 +148,46 @@ class OpenCoordinatesInMapAction(BaseAction):
         Returns:
             Setting value or default_value
         """
-        from qgis.PyQt.QtCore import QSettings
         settings = QSettings()
         key = f"RightClickUtilities/{self.action_id}/{setting_name}"
         return settings.value(key, default_value)
     
-    def _build_map_url(self, lat, lon, map_service, zoom_level):
+    def _prepare_settings(self, values):
+        """
+        Build the cached settings, resolving the map URL pieces once per settings change.
+        
+        Args:
+            values (dict): Typed setting values keyed by their schema names
+        
+        Returns:
+            SimpleNamespace: Settings plus the resolved url_template and clamped url_zoom
+        """
+        map_service = values['map_service']
+        return SimpleNamespace(
+            **values,
+            url_template=_MAP_URL_TEMPLATES.get(map_service, _MAP_URL_TEMPLATES[_DEFAULT_MAP_SERVICE]),
+            url_zoom=max(1, min(20, values['zoom_level'])),
+        )
+    
+    def _build_map_url(self, lat, lon, settings):
         """
         Build the URL for the selected map service.
         
         Args:
             lat (float): Latitude in WGS84
             lon (float): Longitude in WGS84
-            map_service (str): Name of the map service
-            zoom_level (int): Zoom level (1-20)
+            settings (SimpleNamespace): Loaded settings with the resolved URL template and zoom
             
         Returns:
             str: URL to open in browser
         """
-        # Clamp zoom level to valid range
-        zoom = max(1, min(20, zoom_level))
-        
-        # Build URL based on map service
-        if map_service == 'Google Maps':
-            return f"https://www.google.com/maps?q={lat},{lon}&z={zoom}"
-        elif map_service == 'OpenStreetMap':
-            return f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}&zoom={zoom}"
-        elif map_service == 'Bing Maps':
-            return f"https://www.bing.com/maps?cp={lat}~{lon}&lvl={zoom}"
-        elif map_service == 'Mapbox':
-            # Mapbox URL format (note: may require API key for full functionality)
-            return f"https://www.mapbox.com/maps?lat={lat}&lon={lon}&zoom={zoom}"
-        elif map_service == 'Yandex Maps':
-            return f"https://yandex.com/maps/?pt={lon},{lat}&z={zoom}"
-        elif map_service == 'Apple Maps':
-            return f"https://maps.apple.com/?ll={lat},{lon}&z={zoom}"
-        elif map_service == 'Here WeGo':
-            return f"https://wego.here.com/?map={lat},{lon},{zoom},normal"
-        elif map_service == 'Baidu Maps':
-            return f"https://map.baidu.com/?newmap=1&ie=utf-8&s=s%26wd%3D{lat}%2C{lon}"
-        else:
-            # Default to Google Maps
-            return f"https://www.google.com/maps?q={lat},{lon}&z={zoom}"
+        return settings.url_template.format(lat=lat, lon=lon, zoom=settings.url_zoom)
     
     def execute(self, context):
         """Execute the open coordinates in map action."""
         # Get settings with proper type conversion
         try:
-            schema = self.get_settings_schema()
-            map_service = str(self.get_setting('map_service', schema['map_service']['default']))
-            zoom_level = int(self.get_setting('zoom_level', schema['zoom_level']['default']))
-            show_coordinates = bool(self.get_setting('show_coordinates', schema['show_coordinates']['default']))
-            show_success_message = bool(self.get_setting('show_success_message', schema['show_success_message']['default']))
+            settings = self._get_settings()
         except (ValueError, TypeError) as e:
             self.show_error("Error", f"Invalid setting values: {str(e)}")
             return
@@ -160,50 +208,49 @@ class OpenCoordinatesInMapAction(BaseAction):
             # Get canvas CRS
             canvas_crs = canvas.mapSettings().destinationCrs()
             
-            # Transform to WGS84 (EPSG:4326) for map services
-            wgs84_crs = QgsCoordinateReferenceSystem("EPSG:4326")
-            
             # Get coordinates in canvas CRS
             x = click_point.x()
             y = click_point.y()
             
-            # Transform to WGS84 if needed
-            if canvas_crs != wgs84_crs:
+            # Already in WGS84 - no transform needed (authid compare avoids a full CRS compare)
+            canvas_authid = canvas_crs.authid()
+            if canvas_authid == "EPSG:4326":
+                lon, lat = x, y
+            else:
                 try:
-                    transform = QgsCoordinateTransform(canvas_crs, wgs84_crs, QgsProject.instance())
+                    # CRSs without an authority id (e.g. custom WKT) cannot be cached by id
+                    if canvas_authid:
+                        transform = _get_wgs84_transform(canvas_authid)
+                    else:
+                        transform = QgsCoordinateTransform(canvas_crs, _get_wgs84_crs(), QgsProject.instance())
                     transformed_point = transform.transform(x, y)
                     lon = transformed_point.x()
                     lat = transformed_point.y()
                 except Exception as e:
                     self.show_error("Error", f"Failed to transform coordinates to WGS84: {str(e)}")
                     return
-            else:
-                # Already in WGS84
-                lon = x
-                lat = y
             
-            # Validate coordinates (WGS84 bounds)
-            if not (-180 <= lon <= 180) or not (-90 <= lat <= 90):
+            # Validate coordinates (WGS84 bounds); written as a negated "within" check so NaN is rejected too
+            if not (abs(lon) <= 180.0 and abs(lat) <= 90.0):
                 self.show_error("Error", f"Invalid coordinates: Longitude {lon:.6f}, Latitude {lat:.6f}")
                 return
             
             # Build map URL
-            map_url = self._build_map_url(lat, lon, map_service, zoom_level)
+            map_url = self._build_map_url(lat, lon, settings)
             
             # Show coordinates if requested
-            if show_coordinates:
-                coord_text = f"Opening coordinates in {map_service}:\n\n"
-                coord_text += f"Latitude: {lat:.6f}\n"
-                coord_text += f"Longitude: {lon:.6f}\n"
-                coord_text += f"Zoom Level: {zoom_level}"
+            if settings.show_coordinates:
+                coord_text = _COORD_MESSAGE_TEMPLATE.format(service=settings.map_service, lat=lat, lon=lon, zoom=settings.zoom_level)
                 self.show_info("Opening Map", coord_text)
             
             # Open URL in browser
             try:
+                # webbrowser pulls in subprocess/shlex/shutil, so only import it when a map is opened
+                import webbrowser
                 webbrowser.open(map_url)
                 
-                if show_success_message:
-                    self.show_info("Success", f"Opened {map_service} in your browser.")
+                if settings.show_success_message:
+                    self.show_info("Success", f"Opened {settings.map_service} in your browser.")
             except Exception as e:
                 self.show_error("Error", f"Failed to open browser: {str(e)}")
             
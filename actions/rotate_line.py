@@ -6,17 +6,76 @@ User inputs the rotation angle, and the line is rotated around its centroid.
 """
 
 from .base_action import BaseAction
-from qgis.core import QgsGeometry, QgsPointXY, QgsWkbTypes
-from qgis.PyQt.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QFormLayout, QDoubleSpinBox
-)
+from qgis.core import QgsWkbTypes
+from qgis.PyQt.QtCore import QSettings
+from qgis.PyQt.QtWidgets import QDialog
+from types import MappingProxyType
+
+
+# Settings schema is static, so build it once at import time
+_SETTINGS_SCHEMA = MappingProxyType({
+    # ROTATION SETTINGS
+    'default_rotation_angle': {
+        'type': 'float',
+        'default': 0.0,
+        'label': 'Default Rotation Angle',
+        'description': 'Default rotation angle value shown in the input dialog (degrees)',
+        'min': -360.0,
+        'max': 360.0,
+        'step': 1.0,
+    },
+    
+    # BEHAVIOR SETTINGS
+    'confirm_before_rotate': {
+        'type': 'bool',
+        'default': False,
+        'label': 'Confirm Before Rotating',
+        'description': 'Show confirmation dialog before rotating the line',
+    },
+    'show_success_message': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Success Message',
+        'description': 'Display a message when line is rotated successfully',
+    },
+    'show_line_length_info': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Line Length Info',
+        'description': 'Display line length information in the input dialog and success messages',
+    },
+    'auto_commit_changes': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Auto-commit Changes',
+        'description': 'Automatically commit changes after rotating (recommended)',
+    },
+    'handle_edit_mode_automatically': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Handle Edit Mode Automatically',
+        'description': 'Automatically enter/exit edit mode as needed',
+    },
+    'rollback_on_error': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Rollback on Error',
+        'description': 'Rollback changes if rotation operation fails',
+    },
+})
+
+# Success message templates
+_SUCCESS_MESSAGE_TEMPLATE = "Line feature ID {feature_id} rotated successfully by {angle:.1f}°"
+_LINE_LENGTH_TEMPLATE = "\n\nLine length: {length:.2f} map units"
 
 
 class RotateLineDialog(QDialog):
     """Dialog for user input of rotation angle."""
     
     def __init__(self, parent=None, default_angle=0.0, line_length=None):
+        # Widget classes are only needed once the dialog is actually shown
+        from qgis.PyQt.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFormLayout, QDoubleSpinBox
+        
         super().__init__(parent)
         self.setWindowTitle("Rotate Line")
         self.setModal(True)
@@ -26,15 +85,13 @@ class RotateLineDialog(QDialog):
         form_layout = QFormLayout()
         
         # Line length info
-        if line_length is not None:
-            length_label = QLabel(f"Line length: {line_length:.2f} map units")
-            length_label.setStyleSheet("color: gray; font-size: 10px;")
-            form_layout.addRow("", length_label)
+        self.length_label = QLabel()
+        self.length_label.setStyleSheet("color: gray; font-size: 10px;")
+        form_layout.addRow("", self.length_label)
         
         # Rotation angle input
         self.angle_spinbox = QDoubleSpinBox()
         self.angle_spinbox.setRange(-360.0, 360.0)
-        self.angle_spinbox.setValue(default_angle)
         self.angle_spinbox.setSuffix("°")
         self.angle_spinbox.setDecimals(1)
         form_layout.addRow("Rotation Angle:", self.angle_spinbox)
@@ -60,6 +117,22 @@ class RotateLineDialog(QDialog):
         
         self.setLayout(layout)
         
+        self.configure(default_angle, line_length)
+    
+    def configure(self, default_angle=0.0, line_length=None):
+        """
+        Reset the dialog inputs so a single instance can be reused.
+        
+        Args:
+            default_angle (float): Initial rotation angle in degrees
+            line_length (float): Line length to display, hidden if None
+        """
+        if line_length is not None:
+            self.length_label.setText(f"Line length: {line_length:.2f} map units")
+        self.length_label.setVisible(line_length is not None)
+        
+        self.angle_spinbox.setValue(default_angle)
+        
         # Set focus to angle input
         self.angle_spinbox.setFocus()
         self.angle_spinbox.selectAll()
@@ -96,6 +169,9 @@ class RotateLineAction(BaseAction):
         # Feature type support - only works with line features
         self.set_supported_click_types(['line', 'multiline'])
         self.set_supported_geometry_types(['line', 'multiline'])
+        
+        # Dialog is built on first use and reused for later invocations
+        self._dialog = None
     
     def get_settings_schema(self):
         """
@@ -104,56 +180,7 @@ class RotateLineAction(BaseAction):
         Returns:
             dict: Settings schema with setting definitions
         """
-        return {
-            # ROTATION SETTINGS
-            'default_rotation_angle': {
-                'type': 'float',
-                'default': 0.0,
-                'label': 'Default Rotation Angle',
-                'description': 'Default rotation angle value shown in the input dialog (degrees)',
-                'min': -360.0,
-                'max': 360.0,
-                'step': 1.0,
-            },
-            
-            # BEHAVIOR SETTINGS
-            'confirm_before_rotate': {
-                'type': 'bool',
-                'default': False,
-                'label': 'Confirm Before Rotating',
-                'description': 'Show confirmation dialog before rotating the line',
-            },
-            'show_success_message': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Success Message',
-                'description': 'Display a message when line is rotated successfully',
-            },
-            'show_line_length_info': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Line Length Info',
-                'description': 'Display line length information in the input dialog and success messages',
-            },
-            'auto_commit_changes': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Auto-commit Changes',
-                'description': 'Automatically commit changes after rotating (recommended)',
-            },
-            'handle_edit_mode_automatically': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Handle Edit Mode Automatically',
-                'description': 'Automatically enter/exit edit mode as needed',
-            },
-            'rollback_on_error': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Rollback on Error',
-                'description': 'Rollback changes if rotation operation fails',
-            },
-        }
+        return _SETTINGS_SCHEMA
     
     def get_setting(self, setting_name, default_value=None):
         """
@@ -166,11 +193,31 @@ class RotateLineAction(BaseAction):
         Returns:
             Setting value or default_value
         """
-        from qgis.PyQt.QtCore import QSettings
         settings = QSettings()
         key = f"RightClickUtilities/{self.action_id}/{setting_name}"
         return settings.value(key, default_value)
     
+    def _get_dialog(self, default_angle, line_length):
+        """
+        Get the input dialog, creating it on first use.
+        
+        Args:
+            default_angle (float): Initial rotation angle in degrees
+            line_length (float): Line length to display, or None
+        
+        Returns:
+            RotateLineDialog: Dialog configured for this invocation
+        """
+        if self._dialog is None:
+            self._dialog = RotateLineDialog(
+                None,
+                default_angle=default_angle,
+                line_length=line_length
+            )
+        else:
+            self._dialog.configure(default_angle, line_length)
+        return self._dialog
+    
     def execute(self, context):
         """
         Execute the rotate line action.
@@ -180,13 +227,7 @@ class RotateLineAction(BaseAction):
         """
         # Get settings with proper type conversion
         try:
-            default_angle = float(self.get_setting('default_rotation_angle', 0.0))
-            confirm_before_rotate = bool(self.get_setting('confirm_before_rotate', False))
-            show_success = bool(self.get_setting('show_success_message', True))
-            show_line_length = bool(self.get_setting('show_line_length_info', True))
-            auto_commit = bool(self.get_setting('auto_commit_changes', True))
-            handle_edit_mode = bool(self.get_setting('handle_edit_mode_automatically', True))
-            rollback_on_error = bool(self.get_setting('rollback_on_error', True))
+            settings = self._get_settings()
         except (ValueError, TypeError) as e:
             self.show_error("Error", f"Invalid setting values: {str(e)}")
             return
@@ -205,29 +246,29 @@ class RotateLineAction(BaseAction):
         
         # Get feature geometry
         geometry = feature.geometry()
-        if not geometry or geometry.isEmpty():
+        if not geometry:
             self.show_error("Error", "Feature has no valid geometry")
             return
         
-        # Validate that this is a line feature
-        if geometry.type() != QgsWkbTypes.LineGeometry:
+        # Validate that this is a line feature from the WKB type alone, before touching geometry data
+        if QgsWkbTypes.geometryType(geometry.wkbType()) != QgsWkbTypes.LineGeometry:
             self.show_error("Error", "This action only works with line features")
             return
         
+        if geometry.isEmpty():
+            self.show_error("Error", "Feature has no valid geometry")
+            return
+        
         # Calculate line length if requested
         line_length = None
-        if show_line_length:
+        if settings.show_line_length_info:
             try:
                 line_length = geometry.length()
             except Exception:
                 pass
         
         # Show input dialog
-        dialog = RotateLineDialog(
-            None,
-            default_angle=default_angle,
-            line_length=line_length
-        )
+        dialog = self._get_dialog(settings.default_rotation_angle, line_length)
         
         if dialog.exec_() != QDialog.Accepted:
             return  # User cancelled
@@ -236,9 +277,9 @@ class RotateLineAction(BaseAction):
         rotation_angle = dialog.get_angle()
         
         # Confirm rotation if enabled
-        if confirm_before_rotate:
+        if settings.confirm_before_rotate:
             confirmation_message = f"Rotate line feature ID {feature.id()} from layer '{layer.name()}' by {rotation_angle:.1f}°?\n\n"
-            if show_line_length and line_length is not None:
+            if settings.show_line_length_info and line_length is not None:
                 confirmation_message += f"Line length: {line_length:.2f} map units"
             
             if not self.confirm_action("Rotate Line", confirmation_message):
@@ -249,7 +290,7 @@ class RotateLineAction(BaseAction):
         was_in_edit_mode = False
         edit_mode_entered = False
         
-        if handle_edit_mode:
+        if settings.handle_edit_mode_automatically:
             edit_result = self.handle_edit_mode(layer, "line rotation")
             if edit_result[0] is None:  # Error occurred
                 return
@@ -259,40 +300,37 @@ class RotateLineAction(BaseAction):
             # Get centroid as rotation point
             centroid = geometry.centroid().asPoint()
             
-            # Create a copy of the geometry for rotation
-            rotated_geometry = QgsGeometry(geometry)
-            
-            # Rotate the geometry around its centroid
-            rotated_geometry.rotate(rotation_angle, centroid)
+            # Rotate the geometry around its centroid (feature.geometry() already returned a copy)
+            geometry.rotate(rotation_angle, centroid)
             
             # Update feature geometry
-            feature.setGeometry(rotated_geometry)
+            feature.setGeometry(geometry)
             if not layer.updateFeature(feature):
                 self.show_error("Error", "Failed to update line geometry")
                 return
             
             # Commit changes if enabled
-            if auto_commit and handle_edit_mode:
+            if settings.auto_commit_changes and settings.handle_edit_mode_automatically:
                 if not self.commit_changes(layer, "line rotation"):
                     return
             
             # Show success message if enabled
-            if show_success:
-                success_message = f"Line feature ID {feature.id()} rotated successfully by {rotation_angle:.1f}°"
+            if settings.show_success_message:
+                success_message = _SUCCESS_MESSAGE_TEMPLATE.format(feature_id=feature.id(), angle=rotation_angle)
                 
-                if show_line_length and line_length is not None:
-                    success_message += f"\n\nLine length: {line_length:.2f} map units"
+                if settings.show_line_length_info and line_length is not None:
+                    success_message += _LINE_LENGTH_TEMPLATE.format(length=line_length)
                 
                 self.show_info("Success", success_message)
             
         except Exception as e:
             self.show_error("Error", f"Failed to rotate line: {str(e)}")
-            if rollback_on_error and handle_edit_mode:
+            if settings.rollback_on_error and settings.handle_edit_mode_automatically:
                 self.rollback_changes(layer)
         
         finally:
             # Exit edit mode if we entered it
-            if handle_edit_mode:
+            if settings.handle_edit_mode_automatically:
                 self.exit_edit_mode(layer, edit_mode_entered)
 
 
@@ -6,17 +6,85 @@ User inputs the rotation angle, and the polygon is rotated around its centroid.
 """
 
 from .base_action import BaseAction
-from qgis.core import QgsGeometry, QgsPointXY, QgsWkbTypes
-from qgis.PyQt.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QFormLayout, QDoubleSpinBox
-)
+from ._affine import build_affine
+from qgis.core import QgsWkbTypes
+from qgis.PyQt.QtCore import QSettings
+from qgis.PyQt.QtWidgets import QDialog
+from types import MappingProxyType
+
+
+# Settings schema is static, so build it once at import time
+_SETTINGS_SCHEMA = MappingProxyType({
+    # ROTATION SETTINGS
+    'default_rotation_angle': {
+        'type': 'float',
+        'default': 0.0,
+        'label': 'Default Rotation Angle',
+        'description': 'Default rotation angle value shown in the input dialog (degrees)',
+        'min': -360.0,
+        'max': 360.0,
+        'step': 1.0,
+    },
+    'use_bbox_center_for_pivot': {
+        'type': 'bool',
+        'default': False,
+        'label': 'Use Bounding Box Center as Pivot',
+        'description': 'Use the polygon bounding box center instead of the centroid as the rotation pivot (faster for very large geometries)',
+    },
+    
+    # BEHAVIOR SETTINGS
+    'use_default_without_prompt': {
+        'type': 'bool',
+        'default': False,
+        'label': 'Use Default Without Prompt',
+        'description': 'Apply the default rotation angle directly without showing the input dialog',
+    },
+    'confirm_before_rotate': {
+        'type': 'bool',
+        'default': False,
+        'label': 'Confirm Before Rotating',
+        'description': 'Show confirmation dialog before rotating the polygon',
+    },
+    'show_success_message': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Success Message',
+        'description': 'Display a message when polygon is rotated successfully',
+    },
+    'show_polygon_area_info': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Polygon Area Info',
+        'description': 'Display polygon area information in the input dialog and success messages',
+    },
+    'auto_commit_changes': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Auto-commit Changes',
+        'description': 'Automatically commit changes after rotating (recommended)',
+    },
+    'handle_edit_mode_automatically': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Handle Edit Mode Automatically',
+        'description': 'Automatically enter/exit edit mode as needed',
+    },
+    'rollback_on_error': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Rollback on Error',
+        'description': 'Rollback changes if rotation operation fails',
+    },
+})
 
 
 class RotatePolygonDialog(QDialog):
     """Dialog for user input of rotation angle."""
     
     def __init__(self, parent=None, default_angle=0.0, polygon_area=None):
+        # Widget classes are only needed once the dialog is actually shown
+        from qgis.PyQt.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFormLayout, QDoubleSpinBox
+        
         super().__init__(parent)
         self.setWindowTitle("Rotate Polygon")
         self.setModal(True)
@@ -104,56 +172,7 @@ class RotatePolygonAction(BaseAction):
         Returns:
             dict: Settings schema with setting definitions
         """
-        return {
-            # ROTATION SETTINGS
-            'default_rotation_angle': {
-                'type': 'float',
-                'default': 0.0,
-                'label': 'Default Rotation Angle',
-                'description': 'Default rotation angle value shown in the input dialog (degrees)',
-                'min': -360.0,
-                'max': 360.0,
-                'step': 1.0,
-            },
-            
-            # BEHAVIOR SETTINGS
-            'confirm_before_rotate': {
-                'type': 'bool',
-                'default': False,
-                'label': 'Confirm Before Rotating',
-                'description': 'Show confirmation dialog before rotating the polygon',
-            },
-            'show_success_message': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Success Message',
-                'description': 'Display a message when polygon is rotated successfully',
-            },
-            'show_polygon_area_info': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Polygon Area Info',
-                'description': 'Display polygon area information in the input dialog and success messages',
-            },
-            'auto_commit_changes': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Auto-commit Changes',
-                'description': 'Automatically commit changes after rotating (recommended)',
-            },
-            'handle_edit_mode_automatically': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Handle Edit Mode Automatically',
-                'description': 'Automatically enter/exit edit mode as needed',
-            },
-            'rollback_on_error': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Rollback on Error',
-                'description': 'Rollback changes if rotation operation fails',
-            },
-        }
+        return _SETTINGS_SCHEMA
     
     def get_setting(self, setting_name, default_value=None):
         """
@@ -166,7 +185,6 @@ class RotatePolygonAction(BaseAction):
         Returns:
             Setting value or default_value
         """
-        from qgis.PyQt.QtCore import QSettings
         settings = QSettings()
         key = f"RightClickUtilities/{self.action_id}/{setting_name}"
         return settings.value(key, default_value)
@@ -180,13 +198,7 @@ class RotatePolygonAction(BaseAction):
         """
         # Get settings with proper type conversion
         try:
-            default_angle = float(self.get_setting('default_rotation_angle', 0.0))
-            confirm_before_rotate = bool(self.get_setting('confirm_before_rotate', False))
-            show_success = bool(self.get_setting('show_success_message', True))
-            show_polygon_area = bool(self.get_setting('show_polygon_area_info', True))
-            auto_commit = bool(self.get_setting('auto_commit_changes', True))
-            handle_edit_mode = bool(self.get_setting('handle_edit_mode_automatically', True))
-            rollback_on_error = bool(self.get_setting('rollback_on_error', True))
+            settings = self._get_settings()
         except (ValueError, TypeError) as e:
             self.show_error("Error", f"Invalid setting values: {str(e)}")
             return
@@ -216,29 +228,39 @@ class RotatePolygonAction(BaseAction):
         
         # Calculate polygon area if requested
         polygon_area = None
-        if show_polygon_area:
+        if settings.show_polygon_area_info:
             try:
                 polygon_area = geometry.area()
             except Exception:
                 pass
         
-        # Show input dialog
-        dialog = RotatePolygonDialog(
-            None,
-            default_angle=default_angle,
-            polygon_area=polygon_area
-        )
-        
-        if dialog.exec_() != QDialog.Accepted:
-            return  # User cancelled
+        if settings.use_default_without_prompt:
+            # Non-interactive mode - no dialog is built at all
+            rotation_angle = settings.default_rotation_angle
+        else:
+            # Show input dialog
+            dialog = RotatePolygonDialog(
+                None,
+                default_angle=settings.default_rotation_angle,
+                polygon_area=polygon_area
+            )
+            
+            if dialog.exec_() != QDialog.Accepted:
+                return  # User cancelled
+            
+            # Get the user input angle
+            rotation_angle = dialog.get_angle()
         
-        # Get the user input angle
-        rotation_angle = dialog.get_angle()
+        # A zero angle leaves the polygon unchanged, so skip the edit entirely
+        if abs(rotation_angle) < 1e-9:
+            if settings.show_success_message:
+                self.show_info("Rotate Polygon", "Rotation angle is 0° - no changes applied.")
+            return
         
         # Confirm rotation if enabled
-        if confirm_before_rotate:
+        if settings.confirm_before_rotate:
             confirmation_message = f"Rotate polygon feature ID {feature.id()} from layer '{layer.name()}' by {rotation_angle:.1f}°?\n\n"
-            if show_polygon_area and polygon_area is not None:
+            if settings.show_polygon_area_info and polygon_area is not None:
                 confirmation_message += f"Polygon area: {polygon_area:.2f} square map units"
             
             if not self.confirm_action("Rotate Polygon", confirmation_message):
@@ -249,50 +271,69 @@ class RotatePolygonAction(BaseAction):
         was_in_edit_mode = False
         edit_mode_entered = False
         
-        if handle_edit_mode:
+        if settings.handle_edit_mode_automatically:
             edit_result = self.handle_edit_mode(layer, "polygon rotation")
             if edit_result[0] is None:  # Error occurred
                 return
             was_in_edit_mode, edit_mode_entered = edit_result
         
+        # Tracks an edit command that is still open, so failures can discard it
+        edit_command_started = False
+        
         try:
-            # Get centroid as rotation point
-            centroid = geometry.centroid().asPoint()
+            if settings.use_bbox_center_for_pivot:
+                # Bounding box center as rotation point, cheaper than walking every vertex for the centroid
+                centroid = geometry.boundingBox().center()
+            else:
+                # Get centroid as rotation point
+                centroid = geometry.centroid().asPoint()
             
-            # Create a copy of the geometry for rotation
-            rotated_geometry = QgsGeometry(geometry)
+            # Rotate the geometry around its centroid with a single affine transform
+            # (feature.geometry() already returned a copy, so transform it in place)
+            geometry.transform(build_affine(centroid.x(), centroid.y(), angle=rotation_angle))
             
-            # Rotate the geometry around its centroid
-            rotated_geometry.rotate(rotation_angle, centroid)
+            # Record the edit as a single undo step
+            edit_command_started = layer.isEditable()
+            if edit_command_started:
+                layer.beginEditCommand("polygon rotation")
             
-            # Update feature geometry
-            feature.setGeometry(rotated_geometry)
-            if not layer.updateFeature(feature):
-                self.show_error("Error", "Failed to update polygon geometry")
-                return
+            # Update only the geometry, falling back to a full feature update
+            if not layer.changeGeometry(feature.id(), geometry):
+                feature.setGeometry(geometry)
+                if not layer.updateFeature(feature):
+                    if edit_command_started:
+                        layer.destroyEditCommand()
+                    self.show_error("Error", "Failed to update polygon geometry")
+                    return
+            
+            if edit_command_started:
+                layer.endEditCommand()
+                edit_command_started = False
             
             # Commit changes if enabled
-            if auto_commit and handle_edit_mode:
+            if settings.auto_commit_changes and settings.handle_edit_mode_automatically:
                 if not self.commit_changes(layer, "polygon rotation"):
                     return
             
             # Show success message if enabled
-            if show_success:
+            if settings.show_success_message:
                 success_message = f"Polygon feature ID {feature.id()} rotated successfully by {rotation_angle:.1f}°"
                 
-                if show_polygon_area and polygon_area is not None:
+                if settings.show_polygon_area_info and polygon_area is not None:
                     success_message += f"\n\nPolygon area: {polygon_area:.2f} square map units"
                 
-                self.show_info("Success", success_message)
+                self.show_success("Rotate Polygon", success_message)
             
         except Exception as e:
+            if edit_command_started:
+                layer.destroyEditCommand()
             self.show_error("Error", f"Failed to rotate polygon: {str(e)}")
-            if rollback_on_error and handle_edit_mode:
+            if settings.rollback_on_error and settings.handle_edit_mode_automatically:
                 self.rollback_changes(layer)
         
         finally:
             # Exit edit mode if we entered it
-            if handle_edit_mode:
+            if settings.handle_edit_mode_automatically:
                 self.exit_edit_mode(layer, edit_mode_entered)
 
 
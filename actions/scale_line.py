@@ -6,17 +6,85 @@ User inputs the scale factor, and the line is scaled around its centroid.
 """
 
 from .base_action import BaseAction
-from qgis.core import QgsGeometry, QgsPointXY, QgsWkbTypes
-from qgis.PyQt.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QFormLayout, QDoubleSpinBox
-)
+from ._affine import build_affine
+from qgis.core import QgsWkbTypes
+from qgis.PyQt.QtCore import QSettings
+from qgis.PyQt.QtWidgets import QDialog
+from types import MappingProxyType
+
+
+# Settings schema is static, so build it once at import time
+_SETTINGS_SCHEMA = MappingProxyType({
+    # SCALING SETTINGS
+    'default_scale_factor': {
+        'type': 'float',
+        'default': 1.0,
+        'label': 'Default Scale Factor',
+        'description': 'Default scale factor value shown in the input dialog (1.0 = original size)',
+        'min': 0.01,
+        'max': 100.0,
+        'step': 0.1,
+    },
+    'use_bbox_center_for_pivot': {
+        'type': 'bool',
+        'default': False,
+        'label': 'Use Bounding Box Center as Pivot',
+        'description': 'Use the line bounding box center instead of the centroid as the scaling pivot (faster for very large geometries)',
+    },
+    
+    # BEHAVIOR SETTINGS
+    'use_default_without_prompt': {
+        'type': 'bool',
+        'default': False,
+        'label': 'Use Default Without Prompt',
+        'description': 'Apply the default scale factor directly without showing the input dialog',
+    },
+    'confirm_before_scale': {
+        'type': 'bool',
+        'default': False,
+        'label': 'Confirm Before Scaling',
+        'description': 'Show confirmation dialog before scaling the line',
+    },
+    'show_success_message': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Success Message',
+        'description': 'Display a message when line is scaled successfully',
+    },
+    'show_line_length_info': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Line Length Info',
+        'description': 'Display line length information in the input dialog and success messages',
+    },
+    'auto_commit_changes': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Auto-commit Changes',
+        'description': 'Automatically commit changes after scaling (recommended)',
+    },
+    'handle_edit_mode_automatically': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Handle Edit Mode Automatically',
+        'description': 'Automatically enter/exit edit mode as needed',
+    },
+    'rollback_on_error': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Rollback on Error',
+        'description': 'Rollback changes if scaling operation fails',
+    },
+})
 
 
 class ScaleLineDialog(QDialog):
     """Dialog for user input of scale factor."""
     
     def __init__(self, parent=None, default_scale=1.0, line_length=None):
+        # Widget classes are only needed once the dialog is actually shown
+        from qgis.PyQt.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFormLayout, QDoubleSpinBox
+        
         super().__init__(parent)
         self.setWindowTitle("Scale Line")
         self.setModal(True)
@@ -104,56 +172,7 @@ class ScaleLineAction(BaseAction):
         Returns:
             dict: Settings schema with setting definitions
         """
-        return {
-            # SCALING SETTINGS
-            'default_scale_factor': {
-                'type': 'float',
-                'default': 1.0,
-                'label': 'Default Scale Factor',
-                'description': 'Default scale factor value shown in the input dialog (1.0 = original size)',
-                'min': 0.01,
-                'max': 100.0,
-                'step': 0.1,
-            },
-            
-            # BEHAVIOR SETTINGS
-            'confirm_before_scale': {
-                'type': 'bool',
-                'default': False,
-                'label': 'Confirm Before Scaling',
-                'description': 'Show confirmation dialog before scaling the line',
-            },
-            'show_success_message': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Success Message',
-                'description': 'Display a message when line is scaled successfully',
-            },
-            'show_line_length_info': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Line Length Info',
-                'description': 'Display line length information in the input dialog and success messages',
-            },
-            'auto_commit_changes': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Auto-commit Changes',
-                'description': 'Automatically commit changes after scaling (recommended)',
-            },
-            'handle_edit_mode_automatically': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Handle Edit Mode Automatically',
-                'description': 'Automatically enter/exit edit mode as needed',
-            },
-            'rollback_on_error': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Rollback on Error',
-                'description': 'Rollback changes if scaling operation fails',
-            },
-        }
+        return _SETTINGS_SCHEMA
     
     def get_setting(self, setting_name, default_value=None):
         """
@@ -166,7 +185,6 @@ class ScaleLineAction(BaseAction):
         Returns:
             Setting value or default_value
         """
-        from qgis.PyQt.QtCore import QSettings
         settings = QSettings()
         key = f"RightClickUtilities/{self.action_id}/{setting_name}"
         return settings.value(key, default_value)
@@ -180,13 +198,7 @@ class ScaleLineAction(BaseAction):
         """
         # Get settings with proper type conversion
         try:
-            default_scale = float(self.get_setting('default_scale_factor', 1.0))
-            confirm_before_scale = bool(self.get_setting('confirm_before_scale', False))
-            show_success = bool(self.get_setting('show_success_message', True))
-            show_line_length = bool(self.get_setting('show_line_length_info', True))
-            auto_commit = bool(self.get_setting('auto_commit_changes', True))
-            handle_edit_mode = bool(self.get_setting('handle_edit_mode_automatically', True))
-            rollback_on_error = bool(self.get_setting('rollback_on_error', True))
+            settings = self._get_settings()
         except (ValueError, TypeError) as e:
             self.show_error("Error", f"Invalid setting values: {str(e)}")
             return
@@ -216,29 +228,39 @@ class ScaleLineAction(BaseAction):
         
         # Calculate line length if requested
         line_length = None
-        if show_line_length:
+        if settings.show_line_length_info:
             try:
                 line_length = geometry.length()
             except Exception:
                 pass
         
-        # Show input dialog
-        dialog = ScaleLineDialog(
-            None,
-            default_scale=default_scale,
-            line_length=line_length
-        )
-        
-        if dialog.exec_() != QDialog.Accepted:
-            return  # User cancelled
+        if settings.use_default_without_prompt:
+            # Non-interactive mode - no dialog is built at all
+            scale_factor = settings.default_scale_factor
+        else:
+            # Show input dialog
+            dialog = ScaleLineDialog(
+                None,
+                default_scale=settings.default_scale_factor,
+                line_length=line_length
+            )
+            
+            if dialog.exec_() != QDialog.Accepted:
+                return  # User cancelled
+            
+            # Get the user input scale factor
+            scale_factor = dialog.get_scale()
         
-        # Get the user input scale factor
-        scale_factor = dialog.get_scale()
+        # A scale factor of 1.0 leaves the line unchanged, so skip the edit entirely
+        if abs(scale_factor - 1.0) < 1e-9:
+            if settings.show_success_message:
+                self.show_info("Scale Line", "Scale factor is 1.0 - no changes applied.")
+            return
         
         # Confirm scaling if enabled
-        if confirm_before_scale:
+        if settings.confirm_before_scale:
             confirmation_message = f"Scale line feature ID {feature.id()} from layer '{layer.name()}' by {scale_factor:.2f}x?\n\n"
-            if show_line_length and line_length is not None:
+            if settings.show_line_length_info and line_length is not None:
                 new_length = line_length * scale_factor
                 confirmation_message += f"Current length: {line_length:.2f} map units\n"
                 confirmation_message += f"New length: {new_length:.2f} map units"
@@ -251,104 +273,56 @@ class ScaleLineAction(BaseAction):
         was_in_edit_mode = False
         edit_mode_entered = False
         
-        if handle_edit_mode:
+        if settings.handle_edit_mode_automatically:
             edit_result = self.handle_edit_mode(layer, "line scaling")
             if edit_result[0] is None:  # Error occurred
                 return
             was_in_edit_mode, edit_mode_entered = edit_result
         
         try:
-            # Get centroid as scaling center point
-            centroid = geometry.centroid().asPoint()
+            if settings.use_bbox_center_for_pivot:
+                # Bounding box center as scaling center point, cheaper than walking every vertex for the centroid
+                centroid = geometry.boundingBox().center()
+            else:
+                # Get centroid as scaling center point
+                centroid = geometry.centroid().asPoint()
             centroid_x = centroid.x()
             centroid_y = centroid.y()
             
-            # Create a copy of the geometry for scaling
-            scaled_geometry = QgsGeometry(geometry)
-            
-            # Scale the geometry around its centroid by transforming each vertex
-            # Try single line first, then multiline
-            try:
-                # Try as single line first
-                vertices = geometry.asPolyline()
-                scaled_vertices = []
-                
-                for vertex in vertices:
-                    # Calculate offset from centroid
-                    offset_x = vertex.x() - centroid_x
-                    offset_y = vertex.y() - centroid_y
-                    
-                    # Scale the offset
-                    scaled_offset_x = offset_x * scale_factor
-                    scaled_offset_y = offset_y * scale_factor
-                    
-                    # Calculate new vertex position
-                    new_x = centroid_x + scaled_offset_x
-                    new_y = centroid_y + scaled_offset_y
-                    scaled_vertices.append(QgsPointXY(new_x, new_y))
-                
-                # Create new geometry from scaled vertices
-                scaled_geometry = QgsGeometry.fromPolylineXY(scaled_vertices)
-            except (TypeError, AttributeError):
-                # Handle multiline geometry
-                try:
-                    multi_polyline = geometry.asMultiPolyline()
-                    scaled_multi_polyline = []
-                    
-                    for polyline in multi_polyline:
-                        scaled_vertices = []
-                        for vertex in polyline:
-                            # Calculate offset from centroid
-                            offset_x = vertex.x() - centroid_x
-                            offset_y = vertex.y() - centroid_y
-                            
-                            # Scale the offset
-                            scaled_offset_x = offset_x * scale_factor
-                            scaled_offset_y = offset_y * scale_factor
-                            
-                            # Calculate new vertex position
-                            new_x = centroid_x + scaled_offset_x
-                            new_y = centroid_y + scaled_offset_y
-                            scaled_vertices.append(QgsPointXY(new_x, new_y))
-                        
-                        scaled_multi_polyline.append(scaled_vertices)
-                    
-                    # Create new geometry from scaled vertices
-                    scaled_geometry = QgsGeometry.fromMultiPolylineXY(scaled_multi_polyline)
-                except (TypeError, AttributeError):
-                    self.show_error("Error", "Unsupported line geometry type")
-                    return
+            # Scale around the centroid with a single affine transform applied natively
+            # (feature.geometry() already returned a copy, so transform it in place)
+            geometry.transform(build_affine(centroid_x, centroid_y, sx=scale_factor, sy=scale_factor))
             
             # Update feature geometry
-            feature.setGeometry(scaled_geometry)
+            feature.setGeometry(geometry)
             if not layer.updateFeature(feature):
                 self.show_error("Error", "Failed to update line geometry")
                 return
             
             # Commit changes if enabled
-            if auto_commit and handle_edit_mode:
+            if settings.auto_commit_changes and settings.handle_edit_mode_automatically:
                 if not self.commit_changes(layer, "line scaling"):
                     return
             
             # Show success message if enabled
-            if show_success:
+            if settings.show_success_message:
                 success_message = f"Line feature ID {feature.id()} scaled successfully by {scale_factor:.2f}x"
                 
-                if show_line_length and line_length is not None:
+                if settings.show_line_length_info and line_length is not None:
                     new_length = line_length * scale_factor
                     success_message += f"\n\nOriginal length: {line_length:.2f} map units"
                     success_message += f"\nNew length: {new_length:.2f} map units"
                 
-                self.show_info("Success", success_message)
+                self.show_success("Scale Line", success_message)
             
         except Exception as e:
             self.show_error("Error", f"Failed to scale line: {str(e)}")
-            if rollback_on_error and handle_edit_mode:
+            if settings.rollback_on_error and settings.handle_edit_mode_automatically:
                 self.rollback_changes(layer)
         
         finally:
             # Exit edit mode if we entered it
-            if handle_edit_mode:
+            if settings.handle_edit_mode_automatically:
                 self.exit_edit_mode(layer, edit_mode_entered)
 
 
@@ -6,11 +6,95 @@ Each line is scaled around its own centroid.
 """
 
 from .base_action import BaseAction
-from qgis.core import QgsGeometry, QgsPointXY, QgsWkbTypes, QgsFeature
+from ._affine import build_affine
+from qgis.core import QgsGeometry, QgsPointXY, QgsWkbTypes, QgsFeature, QgsAggregateCalculator, QgsFeatureRequest
+from qgis.PyQt.QtCore import QSettings
 from qgis.PyQt.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QFormLayout, QDoubleSpinBox, QGroupBox, QRadioButton, QCheckBox
 )
+from types import MappingProxyType
+
+
+# Settings schema is static, so build it once at import time
+_SETTINGS_SCHEMA = MappingProxyType({
+    # SCALING SETTINGS
+    'default_scale_factor': {
+        'type': 'float',
+        'default': 1.0,
+        'label': 'Default Scale Factor',
+        'description': 'Default scale factor value shown in the input dialog (1.0 = original size)',
+        'min': 0.01,
+        'max': 100.0,
+        'step': 0.1,
+    },
+    'default_scaling_mode': {
+        'type': 'choice',
+        'default': 'individual',
+        'label': 'Default Scaling Mode',
+        'description': 'Default scaling mode: "individual" scales each object around its own centroid, "layer" scales the entire layer around layer centroid',
+        'options': ['individual', 'layer'],
+    },
+    'default_scale_objects': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Default: Scale Object Sizes',
+        'description': 'When scaling the entire layer, also scale each object\'s geometry by default',
+    },
+    
+    # BEHAVIOR SETTINGS
+    'confirm_before_scale': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Confirm Before Scaling',
+        'description': 'Show confirmation dialog before scaling all lines in the layer',
+    },
+    'show_success_message': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Success Message',
+        'description': 'Display a message when layer is scaled successfully',
+    },
+    'show_feature_count': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Feature Count',
+        'description': 'Display feature count information in dialogs and messages',
+    },
+    'auto_commit_changes': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Auto-commit Changes',
+        'description': 'Automatically commit changes after scaling (recommended)',
+    },
+    'handle_edit_mode_automatically': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Handle Edit Mode Automatically',
+        'description': 'Automatically enter/exit edit mode as needed',
+    },
+    'rollback_on_error': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Rollback on Error',
+        'description': 'Rollback changes if scaling operation fails',
+    },
+    'skip_invalid_geometries': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Skip Invalid Geometries',
+        'description': 'Skip features with invalid or empty geometries',
+    },
+})
+
+# Confirmation message templates
+_CONFIRM_INDIVIDUAL_TEMPLATE = "Scale all {count} line features in layer '{layer_name}' by {scale:.2f}x?\n\nEach line will be scaled around its own centroid."
+_CONFIRM_LAYER_TEMPLATE = "Scale entire layer '{layer_name}' ({count} features) by {scale:.2f}x?\n\nDistances between objects will be scaled around the layer centroid.\n{objects_note}"
+
+# Success message templates
+_SUCCESS_MESSAGE_TEMPLATE = "Line layer scaled successfully by {scale:.2f}x"
+_PROCESSED_COUNT_TEMPLATE = "\n\nFeatures processed: {count}"
+_SKIPPED_COUNT_TEMPLATE = "\nFeatures skipped: {count}"
 
 
 class ScaleLineLayerDialog(QDialog):
@@ -26,15 +110,13 @@ class ScaleLineLayerDialog(QDialog):
         form_layout = QFormLayout()
         
         # Feature count info
-        if feature_count is not None:
-            count_label = QLabel(f"Features in layer: {feature_count}")
-            count_label.setStyleSheet("color: gray; font-size: 10px;")
-            form_layout.addRow("", count_label)
+        self.count_label = QLabel()
+        self.count_label.setStyleSheet("color: gray; font-size: 10px;")
+        form_layout.addRow("", self.count_label)
         
         # Scale factor input
         self.scale_spinbox = QDoubleSpinBox()
         self.scale_spinbox.setRange(0.01, 100.0)
-        self.scale_spinbox.setValue(default_scale)
         self.scale_spinbox.setSuffix("x")
         self.scale_spinbox.setDecimals(2)
         form_layout.addRow("Scale Factor:", self.scale_spinbox)
@@ -55,11 +137,6 @@ class ScaleLineLayerDialog(QDialog):
         self.layer_radio = QRadioButton("Scale entire layer")
         self.layer_radio.setToolTip("Scale the layer as a whole around layer centroid (distances between objects are scaled)")
         
-        if default_mode == 'individual':
-            self.individual_radio.setChecked(True)
-        else:
-            self.layer_radio.setChecked(True)
-        
         mode_layout.addWidget(self.individual_radio)
         mode_layout.addWidget(self.layer_radio)
         mode_group.setLayout(mode_layout)
@@ -68,15 +145,11 @@ class ScaleLineLayerDialog(QDialog):
         # Scale object sizes option (only for layer scaling)
         self.scale_objects_checkbox = QCheckBox("Also scale object sizes")
         self.scale_objects_checkbox.setToolTip("When scaling the layer, also scale each line's geometry around its own centroid")
-        self.scale_objects_checkbox.setChecked(default_scale_objects)
         self.scale_objects_checkbox.setEnabled(False)  # Disabled by default, enabled when layer mode is selected
         
         # Connect radio buttons to enable/disable scale objects option
-        def update_scale_objects_enabled():
-            self.scale_objects_checkbox.setEnabled(self.layer_radio.isChecked())
-        
-        self.individual_radio.toggled.connect(lambda checked: update_scale_objects_enabled())
-        self.layer_radio.toggled.connect(lambda checked: update_scale_objects_enabled())
+        self.individual_radio.toggled.connect(self._update_scale_objects_enabled)
+        self.layer_radio.toggled.connect(self._update_scale_objects_enabled)
         
         mode_layout.addWidget(self.scale_objects_checkbox)
         
@@ -94,10 +167,39 @@ class ScaleLineLayerDialog(QDialog):
         
         self.setLayout(layout)
         
+        self.configure(default_scale, feature_count, default_mode, default_scale_objects)
+    
+    def configure(self, default_scale=1.0, feature_count=None, default_mode='individual', default_scale_objects=True):
+        """
+        Reset the dialog inputs so a single instance can be reused.
+        
+        Args:
+            default_scale (float): Initial scale factor
+            feature_count (int): Feature count to display, hidden if None
+            default_mode (str): Initial scaling mode ('individual' or 'layer')
+            default_scale_objects (bool): Initial state of the scale objects checkbox
+        """
+        if feature_count is not None:
+            self.count_label.setText(f"Features in layer: {feature_count}")
+        self.count_label.setVisible(feature_count is not None)
+        
+        self.scale_spinbox.setValue(default_scale)
+        
+        if default_mode == 'individual':
+            self.individual_radio.setChecked(True)
+        else:
+            self.layer_radio.setChecked(True)
+        self.scale_objects_checkbox.setChecked(default_scale_objects)
+        self._update_scale_objects_enabled()
+        
         # Set focus to scale input
         self.scale_spinbox.setFocus()
         self.scale_spinbox.selectAll()
     
+    def _update_scale_objects_enabled(self, checked=False):
+        """Enable the scale objects option only when layer mode is selected."""
+        self.scale_objects_checkbox.setEnabled(self.layer_radio.isChecked())
+    
     def get_values(self):
         """Get the input values."""
         return {
@@ -134,6 +236,9 @@ class ScaleLineLayerAction(BaseAction):
         # Feature type support - only works with line layers
         self.set_supported_click_types(['line', 'multiline'])
         self.set_supported_geometry_types(['line', 'multiline'])
+        
+        # Dialog is built on first use and reused for later invocations
+        self._dialog = None
     
     def get_settings_schema(self):
         """
@@ -142,75 +247,7 @@ class ScaleLineLayerAction(BaseAction):
         Returns:
             dict: Settings schema with setting definitions
         """
-        return {
-            # SCALING SETTINGS
-            'default_scale_factor': {
-                'type': 'float',
-                'default': 1.0,
-                'label': 'Default Scale Factor',
-                'description': 'Default scale factor value shown in the input dialog (1.0 = original size)',
-                'min': 0.01,
-                'max': 100.0,
-                'step': 0.1,
-            },
-            'default_scaling_mode': {
-                'type': 'choice',
-                'default': 'individual',
-                'label': 'Default Scaling Mode',
-                'description': 'Default scaling mode: "individual" scales each object around its own centroid, "layer" scales the entire layer around layer centroid',
-                'options': ['individual', 'layer'],
-            },
-            'default_scale_objects': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Default: Scale Object Sizes',
-                'description': 'When scaling the entire layer, also scale each object\'s geometry by default',
-            },
-            
-            # BEHAVIOR SETTINGS
-            'confirm_before_scale': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Confirm Before Scaling',
-                'description': 'Show confirmation dialog before scaling all lines in the layer',
-            },
-            'show_success_message': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Success Message',
-                'description': 'Display a message when layer is scaled successfully',
-            },
-            'show_feature_count': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Feature Count',
-                'description': 'Display feature count information in dialogs and messages',
-            },
-            'auto_commit_changes': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Auto-commit Changes',
-                'description': 'Automatically commit changes after scaling (recommended)',
-            },
-            'handle_edit_mode_automatically': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Handle Edit Mode Automatically',
-                'description': 'Automatically enter/exit edit mode as needed',
-            },
-            'rollback_on_error': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Rollback on Error',
-                'description': 'Rollback changes if scaling operation fails',
-            },
-            'skip_invalid_geometries': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Skip Invalid Geometries',
-                'description': 'Skip features with invalid or empty geometries',
-            },
-        }
+        return _SETTINGS_SCHEMA
     
     def get_setting(self, setting_name, default_value=None):
         """
@@ -223,11 +260,35 @@ class ScaleLineLayerAction(BaseAction):
         Returns:
             Setting value or default_value
         """
-        from qgis.PyQt.QtCore import QSettings
         settings = QSettings()
         key = f"RightClickUtilities/{self.action_id}/{setting_name}"
         return settings.value(key, default_value)
     
+    def _get_dialog(self, default_scale, feature_count, default_mode, default_scale_objects):
+        """
+        Get the input dialog, creating it on first use.
+        
+        Args:
+            default_scale (float): Initial scale factor
+            feature_count (int): Feature count to display, or None
+            default_mode (str): Initial scaling mode ('individual' or 'layer')
+            default_scale_objects (bool): Initial state of the scale objects checkbox
+        
+        Returns:
+            ScaleLineLayerDialog: Dialog configured for this invocation
+        """
+        if self._dialog is None:
+            self._dialog = ScaleLineLayerDialog(
+                None,
+                default_scale=default_scale,
+                feature_count=feature_count,
+                default_mode=default_mode,
+                default_scale_objects=default_scale_objects
+            )
+        else:
+            self._dialog.configure(default_scale, feature_count, default_mode, default_scale_objects)
+        return self._dialog
+    
     def _scale_line_geometry(self, geometry, scale_factor, center_point=None):
         """
         Scale a line geometry around a center point.
@@ -244,59 +305,29 @@ class ScaleLineLayerAction(BaseAction):
             # Get center point for scaling
             if center_point is None:
                 center_point = geometry.centroid().asPoint()
+        except Exception:
+            return None
+        
+        return self._transform_line_geometry(
+            geometry, build_affine(center_point.x(), center_point.y(), sx=scale_factor, sy=scale_factor)
+        )
+    
+    def _transform_line_geometry(self, geometry, transform):
+        """
+        Apply an affine transform to a line geometry.
+        
+        Args:
+            geometry (QgsGeometry): Line geometry to transform
+            transform (QTransform): Transform to apply
             
-            centroid_x = center_point.x()
-            centroid_y = center_point.y()
-            
-            # Try single line first
-            try:
-                vertices = geometry.asPolyline()
-                scaled_vertices = []
-                
-                for vertex in vertices:
-                    # Calculate offset from center point
-                    offset_x = vertex.x() - centroid_x
-                    offset_y = vertex.y() - centroid_y
-                    
-                    # Scale the offset
-                    scaled_offset_x = offset_x * scale_factor
-                    scaled_offset_y = offset_y * scale_factor
-                    
-                    # Calculate new vertex position
-                    new_x = centroid_x + scaled_offset_x
-                    new_y = centroid_y + scaled_offset_y
-                    scaled_vertices.append(QgsPointXY(new_x, new_y))
-                
-                # Create new geometry from scaled vertices
-                return QgsGeometry.fromPolylineXY(scaled_vertices)
-            except (TypeError, AttributeError):
-                # Handle multiline geometry
-                try:
-                    multi_polyline = geometry.asMultiPolyline()
-                    scaled_multi_polyline = []
-                    
-                    for polyline in multi_polyline:
-                        scaled_vertices = []
-                        for vertex in polyline:
-                            # Calculate offset from center point
-                            offset_x = vertex.x() - centroid_x
-                            offset_y = vertex.y() - centroid_y
-                            
-                            # Scale the offset
-                            scaled_offset_x = offset_x * scale_factor
-                            scaled_offset_y = offset_y * scale_factor
-                            
-                            # Calculate new vertex position
-                            new_x = centroid_x + scaled_offset_x
-                            new_y = centroid_y + scaled_offset_y
-                            scaled_vertices.append(QgsPointXY(new_x, new_y))
-                        
-                        scaled_multi_polyline.append(scaled_vertices)
-                    
-                    # Create new geometry from scaled vertices
-                    return QgsGeometry.fromMultiPolylineXY(scaled_multi_polyline)
-                except (TypeError, AttributeError):
-                    return None
+        Returns:
+            QgsGeometry: Transformed geometry, or None if the transform failed
+        """
+        try:
+            # Single native pass; works for single and multi lines alike
+            transformed_geometry = QgsGeometry(geometry)
+            transformed_geometry.transform(transform)
+            return transformed_geometry
         except Exception:
             return None
     
@@ -309,16 +340,7 @@ class ScaleLineLayerAction(BaseAction):
         """
         # Get settings with proper type conversion
         try:
-            default_scale = float(self.get_setting('default_scale_factor', 1.0))
-            default_mode = str(self.get_setting('default_scaling_mode', 'individual'))
-            default_scale_objects = bool(self.get_setting('default_scale_objects', True))
-            confirm_before_scale = bool(self.get_setting('confirm_before_scale', True))
-            show_success = bool(self.get_setting('show_success_message', True))
-            show_feature_count = bool(self.get_setting('show_feature_count', True))
-            auto_commit = bool(self.get_setting('auto_commit_changes', True))
-            handle_edit_mode = bool(self.get_setting('handle_edit_mode_automatically', True))
-            rollback_on_error = bool(self.get_setting('rollback_on_error', True))
-            skip_invalid = bool(self.get_setting('skip_invalid_geometries', True))
+            settings = self._get_settings()
         except (ValueError, TypeError) as e:
             self.show_error("Error", f"Invalid setting values: {str(e)}")
             return
@@ -334,6 +356,11 @@ class ScaleLineLayerAction(BaseAction):
         detected_feature = detected_features[0]
         layer = detected_feature.layer
         
+        # Validate the layer type once up front instead of failing per feature
+        if QgsWkbTypes.geometryType(layer.wkbType()) != QgsWkbTypes.LineGeometry:
+            self.show_error("Error", "This action only works with line layers")
+            return
+        
         # Get feature count
         feature_count = layer.featureCount()
         
@@ -342,12 +369,11 @@ class ScaleLineLayerAction(BaseAction):
             return
         
         # Show input dialog
-        dialog = ScaleLineLayerDialog(
-            None,
-            default_scale=default_scale,
-            feature_count=feature_count if show_feature_count else None,
-            default_mode=default_mode,
-            default_scale_objects=default_scale_objects
+        dialog = self._get_dialog(
+            settings.default_scale_factor,
+            feature_count if settings.show_feature_count else None,
+            settings.default_scaling_mode,
+            settings.default_scale_objects
         )
         
         if dialog.exec_() != QDialog.Accepted:
@@ -359,29 +385,31 @@ class ScaleLineLayerAction(BaseAction):
         scaling_mode = values['mode']
         scale_objects = values['scale_objects']
         
+        # A scale factor of 1.0 leaves every line unchanged, so skip all geometry work
+        if abs(scale_factor - 1.0) < 1e-12:
+            if settings.show_success_message:
+                self.show_info("Scale Line Layer", "Scale factor is 1.0 - no changes applied.")
+            return
+        
         # Calculate layer centroid if scaling entire layer
         layer_center = None
         if scaling_mode == 'layer':
             try:
                 layer_extent = layer.extent()
+                if layer_extent.isEmpty():
+                    # The cached extent may be stale, so recompute it before falling back
+                    layer.updateExtents()
+                    layer_extent = layer.extent()
+                
                 if not layer_extent.isEmpty():
                     layer_center = layer_extent.center()
                 else:
-                    # Fallback: calculate from features
-                    features = list(layer.getFeatures())
-                    if features:
-                        total_x = 0.0
-                        total_y = 0.0
-                        count = 0
-                        for feature in features:
-                            geometry = feature.geometry()
-                            if geometry and not geometry.isEmpty():
-                                centroid = geometry.centroid().asPoint()
-                                total_x += centroid.x()
-                                total_y += centroid.y()
-                                count += 1
-                        if count > 0:
-                            layer_center = QgsPointXY(total_x / count, total_y / count)
+                    # Fallback: mean of feature centroids, aggregated natively
+                    # (empty geometries give NULL centroids, which the mean ignores)
+                    mean_x, ok_x = layer.aggregate(QgsAggregateCalculator.Mean, 'x(centroid($geometry))')
+                    mean_y, ok_y = layer.aggregate(QgsAggregateCalculator.Mean, 'y(centroid($geometry))')
+                    if ok_x and ok_y and mean_x is not None and mean_y is not None:
+                        layer_center = QgsPointXY(mean_x, mean_y)
             except Exception:
                 pass
             
@@ -390,17 +418,14 @@ class ScaleLineLayerAction(BaseAction):
                 return
         
         # Confirm scaling if enabled
-        if confirm_before_scale:
+        if settings.confirm_before_scale:
             if scaling_mode == 'individual':
-                confirmation_message = f"Scale all {feature_count} line features in layer '{layer.name()}' by {scale_factor:.2f}x?\n\n"
-                confirmation_message += "Each line will be scaled around its own centroid."
+                confirmation_message = _CONFIRM_INDIVIDUAL_TEMPLATE.format(count=feature_count, layer_name=layer.name(), scale=scale_factor)
             else:
-                confirmation_message = f"Scale entire layer '{layer.name()}' ({feature_count} features) by {scale_factor:.2f}x?\n\n"
-                confirmation_message += "Distances between objects will be scaled around the layer centroid."
-                if scale_objects:
-                    confirmation_message += "\nObject sizes will also be scaled."
-                else:
-                    confirmation_message += "\nObject sizes will remain unchanged."
+                objects_note = "Object sizes will also be scaled." if scale_objects else "Object sizes will remain unchanged."
+                confirmation_message = _CONFIRM_LAYER_TEMPLATE.format(
+                    layer_name=layer.name(), count=feature_count, scale=scale_factor, objects_note=objects_note
+                )
             
             if not self.confirm_action("Scale Line Layer", confirmation_message):
                 return
@@ -410,27 +435,38 @@ class ScaleLineLayerAction(BaseAction):
         was_in_edit_mode = False
         edit_mode_entered = False
         
-        if handle_edit_mode:
+        if settings.handle_edit_mode_automatically:
             edit_result = self.handle_edit_mode(layer, "line layer scaling")
             if edit_result[0] is None:  # Error occurred
                 return
             was_in_edit_mode, edit_mode_entered = edit_result
         
+        # Tracks an edit command that is still open, so failures can discard it
+        edit_command_started = False
+        
         try:
             # Process all features in the layer
             success_count = 0
             error_count = 0
             
-            for feature in layer.getFeatures():
+            # Layer scaling around the layer center is the same for every feature
+            layer_transform = None
+            if scaling_mode == 'layer':
+                layer_transform = build_affine(layer_center.x(), layer_center.y(), sx=scale_factor, sy=scale_factor)
+            
+            # Compute all scaled geometries first, then write them in one batch
+            # Only geometries are rewritten, so skip fetching attributes
+            changes = {}
+            for feature in layer.getFeatures(QgsFeatureRequest().setNoAttributes()):
                 geometry = feature.geometry()
                 
                 if not geometry or geometry.isEmpty():
-                    if skip_invalid:
+                    if settings.skip_invalid_geometries:
                         error_count += 1
                         continue
                     else:
                         self.show_error("Error", f"Feature {feature.id()} has invalid geometry")
-                        if rollback_on_error and handle_edit_mode:
+                        if settings.rollback_on_error and settings.handle_edit_mode_automatically:
                             self.rollback_changes(layer)
                         return
                 
@@ -440,60 +476,81 @@ class ScaleLineLayerAction(BaseAction):
                     scaled_geometry = self._scale_line_geometry(geometry, scale_factor)
                 else:
                     # Scale around layer center
-                    scaled_geometry = self._scale_line_geometry(geometry, scale_factor, layer_center)
+                    transform = layer_transform
                     
-                    # If also scaling object sizes, scale again around feature's own centroid
+                    # If also scaling object sizes, scale again around feature's own centroid.
+                    # The centroid moves with the layer scaling, so map it through first and
+                    # compose both scalings into one transform applied in a single pass.
                     if scale_objects:
-                        scaled_geometry = self._scale_line_geometry(scaled_geometry, scale_factor)
+                        centroid = geometry.centroid().asPoint()
+                        moved_x, moved_y = layer_transform.map(centroid.x(), centroid.y())
+                        transform = layer_transform * build_affine(moved_x, moved_y, sx=scale_factor, sy=scale_factor)
+                    
+                    scaled_geometry = self._transform_line_geometry(geometry, transform)
                 
                 if not scaled_geometry:
-                    if skip_invalid:
+                    if settings.skip_invalid_geometries:
                         error_count += 1
                         continue
                     else:
                         self.show_error("Error", f"Failed to scale feature {feature.id()}")
-                        if rollback_on_error and handle_edit_mode:
+                        if settings.rollback_on_error and settings.handle_edit_mode_automatically:
                             self.rollback_changes(layer)
                         return
                 
-                # Update feature geometry
-                feature.setGeometry(scaled_geometry)
-                if not layer.updateFeature(feature):
-                    if skip_invalid:
+                changes[feature.id()] = scaled_geometry
+            
+            # Record the whole layer edit as a single undo step
+            edit_command_started = layer.isEditable()
+            if edit_command_started:
+                layer.beginEditCommand("line layer scaling")
+            
+            for feature_id, scaled_geometry in changes.items():
+                # Update only the geometry; attributes are left untouched
+                if not layer.changeGeometry(feature_id, scaled_geometry):
+                    if settings.skip_invalid_geometries:
                         error_count += 1
                         continue
                     else:
-                        self.show_error("Error", f"Failed to update feature {feature.id()}")
-                        if rollback_on_error and handle_edit_mode:
+                        if edit_command_started:
+                            layer.destroyEditCommand()
+                        self.show_error("Error", f"Failed to update feature {feature_id}")
+                        if settings.rollback_on_error and settings.handle_edit_mode_automatically:
                             self.rollback_changes(layer)
                         return
                 
                 success_count += 1
             
+            if edit_command_started:
+                layer.endEditCommand()
+                edit_command_started = False
+            
             # Commit changes if enabled
-            if auto_commit and handle_edit_mode:
+            if settings.auto_commit_changes and settings.handle_edit_mode_automatically:
                 if not self.commit_changes(layer, "line layer scaling"):
                     return
             
             # Show success message if enabled
-            if show_success:
-                success_message = f"Line layer scaled successfully by {scale_factor:.2f}x"
+            if settings.show_success_message:
+                success_message = _SUCCESS_MESSAGE_TEMPLATE.format(scale=scale_factor)
                 
-                if show_feature_count:
-                    success_message += f"\n\nFeatures processed: {success_count}"
+                if settings.show_feature_count:
+                    success_message += _PROCESSED_COUNT_TEMPLATE.format(count=success_count)
                     if error_count > 0:
-                        success_message += f"\nFeatures skipped: {error_count}"
+                        success_message += _SKIPPED_COUNT_TEMPLATE.format(count=error_count)
                 
                 self.show_info("Success", success_message)
             
         except Exception as e:
+            if edit_command_started:
+                layer.destroyEditCommand()
             self.show_error("Error", f"Failed to scale line layer: {str(e)}")
-            if rollback_on_error and handle_edit_mode:
+            if settings.rollback_on_error and settings.handle_edit_mode_automatically:
                 self.rollback_changes(layer)
         
         finally:
             # Exit edit mode if we entered it
-            if handle_edit_mode:
+            if settings.handle_edit_mode_automatically:
                 self.exit_edit_mode(layer, edit_mode_entered)
 
 
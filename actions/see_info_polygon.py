@@ -6,18 +6,262 @@ geometry details, attributes, layer information, and any available audit data.
 """
 
 from .base_action import BaseAction
-from qgis.core import QgsFeature, QgsVectorLayer, QgsWkbTypes
+from qgis.core import QgsFeatureRequest, QgsVectorLayer, QgsWkbTypes
 from qgis.PyQt.QtWidgets import (
-    QDialog, QVBoxLayout, QTextEdit, QPushButton, QLabel, QScrollArea, QWidget
+    QApplication, QDialog, QVBoxLayout, QPlainTextEdit, QPushButton, QLabel, QScrollArea, QWidget
 )
-from qgis.PyQt.QtCore import Qt
+from qgis.PyQt.QtCore import Qt, QSettings, QTimer, QVariant
+from qgis.PyQt.QtGui import QFont
 from datetime import datetime
+from functools import lru_cache, partial
+import re
+from types import MappingProxyType
+
+
+# Settings schema is static, so build it once at import time
+_SETTINGS_SCHEMA = MappingProxyType({
+    # DISPLAY SETTINGS
+    'show_creation_info': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Creation Info',
+        'description': 'Display creation date/time and creator information if available',
+    },
+    'show_modification_info': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Modification Info',
+        'description': 'Display modification date/time and modifier information if available',
+    },
+    'show_audit_fields': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Audit Fields',
+        'description': 'Display audit fields (created_at, modified_at, created_by, etc.) if present',
+    },
+    'show_edit_buffer_changes': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Edit Buffer Changes',
+        'description': 'Display pending changes in edit buffer if layer is in edit mode',
+    },
+    'show_current_state': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Current State',
+        'description': 'Display current feature state (attributes, geometry info)',
+    },
+    'show_geometry_history': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Geometry History',
+        'description': 'Display geometry information (area, perimeter, vertex count, etc.)',
+    },
+    'show_attribute_history': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Attribute History',
+        'description': 'Display all attribute values and their history if available',
+    },
+    
+    # FORMAT SETTINGS
+    'date_format': {
+        'type': 'str',
+        'default': '%Y-%m-%d %H:%M:%S',
+        'label': 'Date Format',
+        'description': 'Format string for displaying dates (Python strftime format)',
+    },
+    'show_timestamps': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Timestamps',
+        'description': 'Display timestamps in history information',
+    },
+    'show_field_names': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Show Field Names',
+        'description': 'Display field names along with values',
+    },
+    
+    # BEHAVIOR SETTINGS
+    'open_in_dialog': {
+        'type': 'bool',
+        'default': True,
+        'label': 'Open in Dialog',
+        'description': 'Open history in a dialog window. If disabled, shows in information message.',
+    },
+    'copy_to_clipboard': {
+        'type': 'bool',
+        'default': False,
+        'label': 'Copy to Clipboard',
+        'description': 'Automatically copy history to clipboard when displayed',
+    },
+})
+
+# Section rules for the info text, built once instead of on every click
+_H1 = "=" * 70
+_H2 = "-" * 70
+
+# Field types treated as date/time values
+_DATETIME_TYPES = frozenset({QVariant.Date, QVariant.Time, QVariant.DateTime})
+
+# Fallback audit listing: fields never worth listing, and how many fields to show at most
+_SKIP_FIELD_NAMES = frozenset({'id', 'fid', 'objectid', 'shape', 'geometry', 'geom'})
+_MAX_FALLBACK_FIELDS = 20
+
+# Layer properties that are always listed at the end of the info text
+_LAYER_STATE_TEMPLATE = (
+    "Feature Count: {feature_count}\n"
+    "Total Fields: {field_count}\n"
+    "Geometry Type: {geometry_type}\n"
+    "Editable: {editable}\n"
+    "Read Only: {read_only}\n"
+    "Valid: {valid}"
+)
+
+
+@lru_cache(maxsize=32)
+def _crs_unit_name(is_geographic, is_valid, map_units):
+    """
+    Resolve the distance unit name for a CRS from its key properties.
+    
+    Args:
+        is_geographic (bool): Whether the CRS is geographic
+        is_valid (bool): Whether the CRS is valid
+        map_units: Map units of the CRS
+    
+    Returns:
+        str: Lowercase unit name, or None if the units are unknown
+    """
+    if is_geographic:
+        return "degrees"
+    if is_valid and map_units != 0:
+        return map_units.name().lower()
+    return None
+
+
+def _get_crs_unit_name(crs):
+    """
+    Get the distance unit name for a CRS, cached on its key properties.
+    
+    Args:
+        crs (QgsCoordinateReferenceSystem): CRS to describe
+    
+    Returns:
+        str: Lowercase unit name, or None if the units are unknown
+    """
+    return _crs_unit_name(crs.isGeographic(), crs.isValid(), crs.mapUnits())
+
+
+def _compile_substring_patterns(patterns):
+    """
+    Compile substring patterns into a single alternation regex.
+    
+    Args:
+        patterns (tuple): Lowercase substrings to look for
+    
+    Returns:
+        re.Pattern: Pattern matching a string that contains any of the substrings
+    """
+    return re.compile('|'.join(map(re.escape, patterns)))
+
+
+# Field name patterns are matched against lowercased field names, so compile them once at import time
+_CREATION_FIELD_RE = _compile_substring_patterns((
+    'created', 'creation', 'create', 'date_created', 'date_create',
+    'created_by', 'creator', 'created_user', 'user_created',
+    'created_at', 'created_date', 'creation_date',
+    'date_added', 'added_date', 'added_at', 'add_date',
+    'insert', 'inserted', 'insert_date', 'inserted_at',
+    'origin', 'original', 'orig_date', 'origin_date',
+))
+_MODIFICATION_FIELD_RE = _compile_substring_patterns((
+    'modified', 'modification', 'modify', 'mod_date',
+    'updated', 'update', 'upd_date', 'upd_at',
+    'changed', 'change', 'chg_date', 'chg_at',
+    'edited', 'edit', 'edit_date', 'edit_at',
+    'last_modified', 'last_updated', 'last_changed',
+    'date_modified', 'date_updated', 'date_changed',
+    'modified_by', 'modifier', 'modified_user', 'user_modified',
+    'updated_by', 'updater', 'updated_user', 'user_updated',
+    'changed_by', 'changer', 'changed_user', 'user_changed',
+    'edited_by', 'editor', 'edited_user', 'user_edited',
+))
+_AUDIT_FIELD_RE = _compile_substring_patterns((
+    '_at', '_date', '_by', '_user', '_time', '_timestamp',
+    'version', 'revision', 'history', 'hist',
+    'audit', 'track', 'log', 'change', 'modified', 'created', 'updated',
+    'edit', 'add', 'insert', 'delete', 'remove',
+    'user', 'author', 'owner', 'creator', 'modifier', 'editor',
+    'status', 'state', 'stage', 'phase',
+    'id', 'uuid', 'guid', 'oid', 'fid',
+    'source', 'origin', 'reference', 'ref',
+))
+_METADATA_FIELD_RE = _compile_substring_patterns(('meta', 'info', 'note', 'comment', 'desc'))
+
+# Hints used to tell creation and modification date fields apart
+_CREATION_HINT_RE = _compile_substring_patterns(('create', 'add', 'insert', 'origin', 'first'))
+_MODIFICATION_HINT_RE = _compile_substring_patterns(('modify', 'update', 'change', 'edit', 'last'))
+
+
+def _classify_fields(fields):
+    """
+    Sort field indices into the groups used by the info sections in a single pass.
+    
+    Args:
+        fields (QgsFields): Fields of the layer
+    
+    Returns:
+        dict: Field index lists keyed by 'creation', 'creation_dates', 'modification',
+            'modification_dates', 'audit' and 'other'
+    """
+    groups = {
+        'creation': [],
+        'creation_dates': [],
+        'modification': [],
+        'modification_dates': [],
+        'audit': [],
+        'other': [],
+    }
+    for i, field in enumerate(fields):
+        field_name_lower = field.name().lower()
+        is_date_time = field.type() in _DATETIME_TYPES
+        
+        if _CREATION_FIELD_RE.search(field_name_lower):
+            groups['creation'].append(i)
+        if _MODIFICATION_FIELD_RE.search(field_name_lower):
+            groups['modification'].append(i)
+        
+        # Date/time fields can stand in for creation or modification info by name hint
+        if is_date_time:
+            if _CREATION_HINT_RE.search(field_name_lower):
+                groups['creation_dates'].append(i)
+            elif _MODIFICATION_HINT_RE.search(field_name_lower):
+                groups['modification_dates'].append(i)
+        
+        # Date/time fields and audit- or metadata-like names are likely audit fields
+        if is_date_time or _AUDIT_FIELD_RE.search(field_name_lower) or _METADATA_FIELD_RE.search(field_name_lower):
+            groups['audit'].append(i)
+        else:
+            groups['other'].append(i)
+    
+    return groups
 
 
 class InfoViewerDialog(QDialog):
     """Dialog for displaying feature information."""
     
-    def __init__(self, parent=None, info_text=""):
+    def __init__(self, parent=None, info_text="", text_builder=None):
+        """
+        Initialize the dialog.
+        
+        Args:
+            parent (QWidget): Parent widget
+            info_text (str): Text to display
+            text_builder (callable): Optional callable returning the text; when given, it is
+                run only after the dialog is shown, so the window opens without waiting for it
+        """
         super().__init__(parent)
         self.setWindowTitle("Feature Information")
         self.setModal(True)
@@ -25,14 +269,20 @@ class InfoViewerDialog(QDialog):
         
         layout = QVBoxLayout()
         
-        # Info text display
-        self.info_text = QTextEdit()
+        # Info text display; the text is never rich, so use the lighter plain text widget
+        self.info_text = QPlainTextEdit()
         self.info_text.setReadOnly(True)
-        self.info_text.setPlainText(info_text)
-        self.info_text.setFontFamily("Courier")
-        self.info_text.setFontPointSize(9)
+        self.info_text.setFont(QFont("Courier", 9))
         layout.addWidget(self.info_text)
         
+        self._text_builder = text_builder
+        if text_builder is None:
+            self.info_text.setPlainText(info_text)
+        else:
+            self.info_text.setPlainText("Loading feature information...")
+            # Runs once the event loop is up, i.e. after the dialog has been painted
+            QTimer.singleShot(0, self._populate)
+        
         # Buttons
         button_layout = QVBoxLayout()
         
@@ -49,9 +299,16 @@ class InfoViewerDialog(QDialog):
         layout.addLayout(button_layout)
         self.setLayout(layout)
     
+    def _populate(self):
+        """Build the deferred info text and show it."""
+        try:
+            info_text = self._text_builder()
+        except Exception as e:
+            info_text = f"Failed to retrieve feature information: {str(e)}"
+        self.info_text.setPlainText(info_text)
+    
     def copy_to_clipboard(self):
         """Copy info text to clipboard."""
-        from qgis.PyQt.QtWidgets import QApplication
         clipboard = QApplication.clipboard()
         clipboard.setText(self.info_text.toPlainText())
 
@@ -90,85 +347,7 @@ class SeeInfoPolygonAction(BaseAction):
         Returns:
             dict: Settings schema with setting definitions
         """
-        return {
-            # DISPLAY SETTINGS
-            'show_creation_info': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Creation Info',
-                'description': 'Display creation date/time and creator information if available',
-            },
-            'show_modification_info': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Modification Info',
-                'description': 'Display modification date/time and modifier information if available',
-            },
-            'show_audit_fields': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Audit Fields',
-                'description': 'Display audit fields (created_at, modified_at, created_by, etc.) if present',
-            },
-            'show_edit_buffer_changes': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Edit Buffer Changes',
-                'description': 'Display pending changes in edit buffer if layer is in edit mode',
-            },
-            'show_current_state': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Current State',
-                'description': 'Display current feature state (attributes, geometry info)',
-            },
-            'show_geometry_history': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Geometry History',
-                'description': 'Display geometry information (area, perimeter, vertex count, etc.)',
-            },
-            'show_attribute_history': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Attribute History',
-                'description': 'Display all attribute values and their history if available',
-            },
-            
-            # FORMAT SETTINGS
-            'date_format': {
-                'type': 'str',
-                'default': '%Y-%m-%d %H:%M:%S',
-                'label': 'Date Format',
-                'description': 'Format string for displaying dates (Python strftime format)',
-            },
-            'show_timestamps': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Timestamps',
-                'description': 'Display timestamps in history information',
-            },
-            'show_field_names': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Show Field Names',
-                'description': 'Display field names along with values',
-            },
-            
-            # BEHAVIOR SETTINGS
-            'open_in_dialog': {
-                'type': 'bool',
-                'default': True,
-                'label': 'Open in Dialog',
-                'description': 'Open history in a dialog window. If disabled, shows in information message.',
-            },
-            'copy_to_clipboard': {
-                'type': 'bool',
-                'default': False,
-                'label': 'Copy to Clipboard',
-                'description': 'Automatically copy history to clipboard when displayed',
-            },
-        }
+        return _SETTINGS_SCHEMA
     
     def get_setting(self, setting_name, default_value=None):
         """
@@ -181,7 +360,6 @@ class SeeInfoPolygonAction(BaseAction):
         Returns:
             Setting value or default_value
         """
-        from qgis.PyQt.QtCore import QSettings
         settings = QSettings()
         key = f"RightClickUtilities/{self.action_id}/{setting_name}"
         return settings.value(key, default_value)
@@ -195,18 +373,7 @@ class SeeInfoPolygonAction(BaseAction):
         """
         # Get settings with proper type conversion
         try:
-            show_creation_info = bool(self.get_setting('show_creation_info', True))
-            show_modification_info = bool(self.get_setting('show_modification_info', True))
-            show_audit_fields = bool(self.get_setting('show_audit_fields', True))
-            show_edit_buffer = bool(self.get_setting('show_edit_buffer_changes', True))
-            show_current_state = bool(self.get_setting('show_current_state', True))
-            show_geometry_history = bool(self.get_setting('show_geometry_history', True))
-            show_attribute_history = bool(self.get_setting('show_attribute_history', True))
-            date_format = str(self.get_setting('date_format', '%Y-%m-%d %H:%M:%S'))
-            show_timestamps = bool(self.get_setting('show_timestamps', True))
-            show_field_names = bool(self.get_setting('show_field_names', True))
-            open_in_dialog = bool(self.get_setting('open_in_dialog', True))
-            copy_to_clipboard = bool(self.get_setting('copy_to_clipboard', False))
+            settings = self._get_settings()
         except (ValueError, TypeError) as e:
             self.show_error("Error", f"Invalid setting values: {str(e)}")
             return
@@ -229,33 +396,42 @@ class SeeInfoPolygonAction(BaseAction):
             return
         
         try:
-            # Build info text
-            info_text = self._build_info_text(
-                feature, layer,
-                show_creation_info, show_modification_info, show_audit_fields,
-                show_edit_buffer, show_current_state, show_geometry_history,
-                show_attribute_history, date_format, show_timestamps, show_field_names
+            # Snapshot the feature data once; every section reads from these copies
+            attrs = feature.attributes()
+            geometry = feature.geometry()
+            
+            build_info_text = partial(
+                self._build_info_text,
+                feature, layer, attrs, geometry,
+                settings.show_creation_info, settings.show_modification_info, settings.show_audit_fields,
+                settings.show_edit_buffer_changes, settings.show_current_state, settings.show_geometry_history,
+                settings.show_attribute_history, settings.date_format, settings.show_timestamps, settings.show_field_names
             )
             
+            # The dialog can build the text itself once it is on screen, unless it is needed up front
+            if settings.open_in_dialog and not settings.copy_to_clipboard:
+                dialog = InfoViewerDialog(None, text_builder=build_info_text)
+                dialog.exec_()
+                return
+            
+            # Build info text
+            info_text = build_info_text()
+            
+            # Copy before showing, so the text is on the clipboard while the dialog is open
+            if settings.copy_to_clipboard:
+                QApplication.clipboard().setText(info_text)
+            
             # Display info
-            if open_in_dialog:
+            if settings.open_in_dialog:
                 dialog = InfoViewerDialog(None, info_text)
-                if copy_to_clipboard:
-                    from qgis.PyQt.QtWidgets import QApplication
-                    clipboard = QApplication.clipboard()
-                    clipboard.setText(info_text)
                 dialog.exec_()
             else:
                 self.show_info("Feature Information", info_text)
-                if copy_to_clipboard:
-                    from qgis.PyQt.QtWidgets import QApplication
-                    clipboard = QApplication.clipboard()
-                    clipboard.setText(info_text)
             
         except Exception as e:
             self.show_error("Error", f"Failed to retrieve feature information: {str(e)}")
     
-    def _build_info_text(self, feature, layer, show_creation_info, show_modification_info,
+    def _build_info_text(self, feature, layer, attrs, geometry, show_creation_info, show_modification_info,
                            show_audit_fields, show_edit_buffer, show_current_state,
                            show_geometry_history, show_attribute_history, date_format,
                            show_timestamps, show_field_names):
@@ -265,6 +441,8 @@ class SeeInfoPolygonAction(BaseAction):
         Args:
             feature (QgsFeature): Feature to get info for
             layer (QgsVectorLayer): Layer containing the feature
+            attrs (list): Attribute values of the feature
+            geometry (QgsGeometry): Geometry of the feature
             show_* (bool): Flags for what to include
             date_format (str): Date format string
             show_timestamps (bool): Whether to show timestamps
@@ -274,9 +452,9 @@ class SeeInfoPolygonAction(BaseAction):
             str: Formatted info text
         """
         lines = []
-        lines.append("=" * 70)
+        lines.append(_H1)
         lines.append("FEATURE INFORMATION")
-        lines.append("=" * 70)
+        lines.append(_H1)
         lines.append("")
         
         # Basic feature info
@@ -291,42 +469,49 @@ class SeeInfoPolygonAction(BaseAction):
             lines.append(f"Information Retrieved: {current_time}")
             lines.append("")
         
+        # Fetch the layer fields once and share them with the section helpers
+        fields = layer.fields()
+        
+        # Classify fields once for the creation, modification and audit sections
+        if show_creation_info or show_modification_info or show_audit_fields:
+            classified_fields = _classify_fields(fields)
+        
         # Creation info - only show if data exists
         if show_creation_info:
-            creation_info = self._get_creation_info(feature, layer, date_format, show_field_names)
+            creation_info = self._get_creation_info(attrs, fields, classified_fields, date_format, show_field_names)
             if creation_info:
-                lines.append("-" * 70)
+                lines.append(_H2)
                 lines.append("CREATION INFORMATION")
-                lines.append("-" * 70)
+                lines.append(_H2)
                 lines.append(creation_info)
                 lines.append("")
         
         # Modification info - only show if data exists
         if show_modification_info:
-            modification_info = self._get_modification_info(feature, layer, date_format, show_field_names)
+            modification_info = self._get_modification_info(attrs, fields, classified_fields, date_format, show_field_names)
             if modification_info:
-                lines.append("-" * 70)
+                lines.append(_H2)
                 lines.append("MODIFICATION INFORMATION")
-                lines.append("-" * 70)
+                lines.append(_H2)
                 lines.append(modification_info)
                 lines.append("")
         
         # Audit fields - only show if data exists
         if show_audit_fields:
-            audit_info = self._get_audit_fields(feature, layer, date_format, show_field_names)
+            audit_info = self._get_audit_fields(attrs, fields, classified_fields, date_format, show_field_names)
             if audit_info:
-                lines.append("-" * 70)
+                lines.append(_H2)
                 lines.append("AUDIT FIELDS")
-                lines.append("-" * 70)
+                lines.append(_H2)
                 lines.append(audit_info)
                 lines.append("")
         
         # Edit buffer changes
         if show_edit_buffer and layer.isEditable():
-            lines.append("-" * 70)
+            lines.append(_H2)
             lines.append("PENDING CHANGES (Edit Buffer)")
-            lines.append("-" * 70)
-            edit_buffer_info = self._get_edit_buffer_info(feature, layer, show_field_names)
+            lines.append(_H2)
+            edit_buffer_info = self._get_edit_buffer_info(feature, layer, attrs, geometry, show_field_names)
             if edit_buffer_info:
                 lines.append(edit_buffer_info)
             else:
@@ -335,28 +520,28 @@ class SeeInfoPolygonAction(BaseAction):
         
         # Current state - Geometry (always show, more detailed)
         if show_current_state and show_geometry_history:
-            lines.append("-" * 70)
+            lines.append(_H2)
             lines.append("GEOMETRY INFORMATION")
-            lines.append("-" * 70)
-            geometry_info = self._get_geometry_info(feature, layer, show_field_names)
+            lines.append(_H2)
+            geometry_info = self._get_geometry_info(geometry, layer, show_field_names)
             if geometry_info:
                 lines.append(geometry_info)
             lines.append("")
         
         # Current state - Attributes (always show, more detailed)
         if show_current_state and show_attribute_history:
-            lines.append("-" * 70)
+            lines.append(_H2)
             lines.append("ATTRIBUTE INFORMATION")
-            lines.append("-" * 70)
-            attribute_info = self._get_attribute_info(feature, layer, show_field_names)
+            lines.append(_H2)
+            attribute_info = self._get_attribute_info(attrs, layer, show_field_names)
             if attribute_info:
                 lines.append(attribute_info)
             lines.append("")
         
         # Layer metadata (more detailed)
-        lines.append("-" * 70)
+        lines.append(_H2)
         lines.append("LAYER INFORMATION")
-        lines.append("-" * 70)
+        lines.append(_H2)
         lines.append(f"Layer Name: {layer.name()}")
         lines.append(f"Layer ID: {layer.id()}")
         lines.append(f"Data Source: {layer.source()}")
@@ -366,233 +551,126 @@ class SeeInfoPolygonAction(BaseAction):
         lines.append(f"CRS: {crs.authid()}")
         lines.append(f"CRS Description: {crs.description()}")
         try:
-            if crs.isGeographic():
-                unit_name = "degrees"
-            elif crs.isValid() and crs.mapUnits() != 0:
-                unit_name = crs.mapUnits().name().lower()
-            else:
-                unit_name = "unknown"
+            unit_name = _get_crs_unit_name(crs) or "unknown"
             lines.append(f"CRS Units: {unit_name}")
         except:
             lines.append(f"CRS Units: unknown")
         lines.append("")
-        lines.append(f"Feature Count: {layer.featureCount()}")
-        lines.append(f"Total Fields: {len(layer.fields())}")
-        lines.append(f"Geometry Type: {layer.geometryType()}")
-        lines.append(f"Editable: {layer.isEditable()}")
-        lines.append(f"Read Only: {layer.readOnly()}")
-        lines.append(f"Valid: {layer.isValid()}")
+        lines.append(_LAYER_STATE_TEMPLATE.format(
+            feature_count=layer.featureCount(),
+            field_count=len(fields),
+            geometry_type=layer.geometryType(),
+            editable=layer.isEditable(),
+            read_only=layer.readOnly(),
+            valid=layer.isValid()
+        ))
         if hasattr(layer, 'crsTransformContext'):
             lines.append(f"Has CRS Transform: {layer.crsTransformContext().isValid()}")
         lines.append("")
         
-        lines.append("=" * 70)
+        lines.append(_H1)
         
         return "\n".join(lines)
     
-    def _get_creation_info(self, feature, layer, date_format, show_field_names):
+    def _get_creation_info(self, attrs, fields, classified_fields, date_format, show_field_names):
         """Get creation information from feature."""
         info_lines = []
         
-        # Check for common creation fields (case-insensitive)
-        creation_field_patterns = ['created', 'creation', 'create', 'date_created', 'date_create',
-                                  'created_by', 'creator', 'created_user', 'user_created',
-                                  'created_at', 'created_date', 'creation_date',
-                                  'date_added', 'added_date', 'added_at', 'add_date',
-                                  'insert', 'inserted', 'insert_date', 'inserted_at',
-                                  'origin', 'original', 'orig_date', 'origin_date']
-        
-        fields = layer.fields()
-        found_fields = set()
+        # Fields whose names match a creation pattern; only text values need a blank check,
+        # so other values are not converted to strings just to test them
+        for i in classified_fields['creation']:
+            value = attrs[i]
+            if value and (not isinstance(value, str) or value.strip()):
+                if show_field_names:
+                    info_lines.append(f"{fields.at(i).name()}: {value}")
+                else:
+                    info_lines.append(f"Created: {value}")
         
-        # Search all fields for creation-related patterns
-        for field in fields:
-            field_name_lower = field.name().lower()
-            field_name = field.name()
-            
-            # Check if field name matches any creation pattern
-            for pattern in creation_field_patterns:
-                if pattern in field_name_lower and field_name not in found_fields:
-                    value = feature.attribute(field_name)
-                    if value and str(value).strip():
-                        found_fields.add(field_name)
-                        if show_field_names:
-                            info_lines.append(f"{field_name}: {value}")
-                        else:
-                            info_lines.append(f"Created: {value}")
-                        break
-        
-        # Also check for date/time fields that might be creation dates
-        date_fields = []
-        for field in fields:
-            field_type = field.type()
-            field_name = field.name()
-            # Check for date/time field types
-            if field_type in [14, 15, 16, 17, 18]:  # Date, Time, DateTime types
-                value = feature.attribute(field_name)
-                if value and str(value).strip():
-                    date_fields.append((field_name, value))
-        
-        # If we found date fields but no creation info, check if any look like creation dates
-        if not info_lines and date_fields:
-            # Check field names for creation hints
-            for field_name, value in date_fields:
-                field_name_lower = field_name.lower()
-                if any(hint in field_name_lower for hint in ['create', 'add', 'insert', 'origin', 'first']):
-                    if field_name not in found_fields:
-                        found_fields.add(field_name)
-                        if show_field_names:
-                            info_lines.append(f"{field_name}: {value}")
-                        else:
-                            info_lines.append(f"Created: {value}")
+        # If there is no creation info, fall back to date/time fields with creation hints
+        if not info_lines:
+            for i in classified_fields['creation_dates']:
+                value = attrs[i]
+                if value and (not isinstance(value, str) or value.strip()):
+                    if show_field_names:
+                        info_lines.append(f"{fields.at(i).name()}: {value}")
+                    else:
+                        info_lines.append(f"Created: {value}")
         
         # Check for version field (might indicate creation)
-        version_field = layer.fields().indexFromName('version')
+        version_field = fields.indexFromName('version')
         if version_field >= 0:
-            version = feature.attribute(version_field)
+            version = attrs[version_field]
             if version:
                 info_lines.append(f"Version: {version}")
         
         return "\n".join(info_lines) if info_lines else None
     
-    def _get_modification_info(self, feature, layer, date_format, show_field_names):
+    def _get_modification_info(self, attrs, fields, classified_fields, date_format, show_field_names):
         """Get modification information from feature."""
         info_lines = []
         
-        # Check for common modification fields (case-insensitive)
-        modification_field_patterns = ['modified', 'modification', 'modify', 'mod_date',
-                                     'updated', 'update', 'upd_date', 'upd_at',
-                                     'changed', 'change', 'chg_date', 'chg_at',
-                                     'edited', 'edit', 'edit_date', 'edit_at',
-                                     'last_modified', 'last_updated', 'last_changed',
-                                     'date_modified', 'date_updated', 'date_changed',
-                                     'modified_by', 'modifier', 'modified_user', 'user_modified',
-                                     'updated_by', 'updater', 'updated_user', 'user_updated',
-                                     'changed_by', 'changer', 'changed_user', 'user_changed',
-                                     'edited_by', 'editor', 'edited_user', 'user_edited']
-        
-        fields = layer.fields()
-        found_fields = set()
+        # Fields whose names match a modification pattern
+        for i in classified_fields['modification']:
+            value = attrs[i]
+            if value and (not isinstance(value, str) or value.strip()):
+                if show_field_names:
+                    info_lines.append(f"{fields.at(i).name()}: {value}")
+                else:
+                    info_lines.append(f"Modified: {value}")
         
-        # Search all fields for modification-related patterns
-        for field in fields:
-            field_name_lower = field.name().lower()
-            field_name = field.name()
-            
-            # Check if field name matches any modification pattern
-            for pattern in modification_field_patterns:
-                if pattern in field_name_lower and field_name not in found_fields:
-                    value = feature.attribute(field_name)
-                    if value and str(value).strip():
-                        found_fields.add(field_name)
-                        if show_field_names:
-                            info_lines.append(f"{field_name}: {value}")
-                        else:
-                            info_lines.append(f"Modified: {value}")
-                        break
-        
-        # Also check for date/time fields that might be modification dates
-        date_fields = []
-        for field in fields:
-            field_type = field.type()
-            field_name = field.name()
-            # Check for date/time field types
-            if field_type in [14, 15, 16, 17, 18]:  # Date, Time, DateTime types
-                value = feature.attribute(field_name)
-                if value and str(value).strip():
-                    field_name_lower = field_name.lower()
-                    # Skip if already found as creation field
-                    if not any(hint in field_name_lower for hint in ['create', 'add', 'insert', 'origin', 'first']):
-                        date_fields.append((field_name, value))
-        
-        # If we found date fields but no modification info, check if any look like modification dates
-        if not info_lines and date_fields:
-            # Check field names for modification hints
-            for field_name, value in date_fields:
-                field_name_lower = field_name.lower()
-                if any(hint in field_name_lower for hint in ['modify', 'update', 'change', 'edit', 'last']):
-                    if field_name not in found_fields:
-                        found_fields.add(field_name)
-                        if show_field_names:
-                            info_lines.append(f"{field_name}: {value}")
-                        else:
-                            info_lines.append(f"Modified: {value}")
+        # If there is no modification info, fall back to date/time fields with modification hints
+        if not info_lines:
+            for i in classified_fields['modification_dates']:
+                value = attrs[i]
+                if value and (not isinstance(value, str) or value.strip()):
+                    if show_field_names:
+                        info_lines.append(f"{fields.at(i).name()}: {value}")
+                    else:
+                        info_lines.append(f"Modified: {value}")
         
         return "\n".join(info_lines) if info_lines else None
     
-    def _get_audit_fields(self, feature, layer, date_format, show_field_names):
+    def _get_audit_fields(self, attrs, fields, classified_fields, date_format, show_field_names):
         """Get all audit-related fields from feature."""
         info_lines = []
         
-        # Common audit field patterns (expanded list)
-        audit_patterns = ['_at', '_date', '_by', '_user', '_time', '_timestamp',
-                         'version', 'revision', 'history', 'hist',
-                         'audit', 'track', 'log', 'change', 'modified', 'created', 'updated',
-                         'edit', 'add', 'insert', 'delete', 'remove',
-                         'user', 'author', 'owner', 'creator', 'modifier', 'editor',
-                         'status', 'state', 'stage', 'phase',
-                         'id', 'uuid', 'guid', 'oid', 'fid',
-                         'source', 'origin', 'reference', 'ref']
-        
-        fields = layer.fields()
-        found_fields = set()
-        
-        # First pass: Check all fields for audit patterns
-        for field in fields:
-            field_name = field.name()
-            field_name_lower = field.name().lower()
-            value = feature.attribute(field_name)
+        # First pass: fields classified as audit fields by name or date/time type
+        for i in classified_fields['audit']:
+            value = attrs[i]
             
             # Skip if value is empty/null
             if not value or (isinstance(value, str) and not value.strip()):
                 continue
             
-            # Check if field matches audit patterns
-            matches_pattern = False
-            for pattern in audit_patterns:
-                if pattern in field_name_lower:
-                    matches_pattern = True
-                    break
-            
-            # Also check field type - date/time fields are likely audit fields
-            field_type = field.type()
-            is_date_time = field_type in [14, 15, 16, 17, 18]  # Date, Time, DateTime types
-            
-            # Also check if field name suggests it's metadata/audit
-            is_metadata_like = any(meta in field_name_lower for meta in ['meta', 'info', 'note', 'comment', 'desc'])
-            
-            if matches_pattern or is_date_time or is_metadata_like:
-                if field_name not in found_fields:
-                    found_fields.add(field_name)
-                    if show_field_names:
-                        info_lines.append(f"{field_name}: {value}")
-                    else:
-                        info_lines.append(f"{field_name}: {value}")
+            info_lines.append(f"{fields.at(i).name()}: {value}")
         
-        # Second pass: Show ALL fields if we didn't find many audit fields
+        # Second pass: Show the remaining fields if we didn't find many audit fields
         if len(info_lines) < 3:
             # Show all non-empty fields as potential audit fields
             all_fields_info = []
-            for field in fields:
-                field_name = field.name()
-                if field_name not in found_fields:
-                    value = feature.attribute(field_name)
-                    if value and str(value).strip():
-                        # Skip geometry fields and very common non-audit fields
-                        skip_fields = ['id', 'fid', 'objectid', 'shape', 'geometry', 'geom']
-                        if field_name.lower() not in skip_fields:
+            hidden_count = 0
+            for i in classified_fields['other']:
+                value = attrs[i]
+                if value and (not isinstance(value, str) or value.strip()):
+                    field_name = fields.at(i).name()
+                    # Skip geometry fields and very common non-audit fields
+                    if field_name.lower() not in _SKIP_FIELD_NAMES:
+                        # Limit the listing to avoid clutter; the rest are only counted
+                        if len(all_fields_info) < _MAX_FALLBACK_FIELDS:
                             all_fields_info.append(f"{field_name}: {value}")
+                        else:
+                            hidden_count += 1
             
             if all_fields_info:
                 info_lines.append("")
                 info_lines.append("All available fields (may contain history info):")
-                info_lines.extend(all_fields_info[:20])  # Limit to first 20 to avoid clutter
-                if len(all_fields_info) > 20:
-                    info_lines.append(f"... and {len(all_fields_info) - 20} more fields")
+                info_lines.extend(all_fields_info)
+                if hidden_count:
+                    info_lines.append(f"... and {hidden_count} more fields")
         
         return "\n".join(info_lines) if info_lines else None
     
-    def _get_edit_buffer_info(self, feature, layer, show_field_names):
+    def _get_edit_buffer_info(self, feature, layer, attrs, geometry, show_field_names):
         """Get pending changes from edit buffer."""
         info_lines = []
         
@@ -600,19 +678,24 @@ class SeeInfoPolygonAction(BaseAction):
             return None
         
         try:
-            # Check if feature has pending changes
-            # Get original feature from data provider
-            original_feature = QgsFeature()
-            if layer.dataProvider().getFeatures([feature.id()]):
-                provider_features = list(layer.dataProvider().getFeatures([feature.id()]))
-                if provider_features:
-                    original_feature = provider_features[0]
+            # Check if feature has pending changes in the edit buffer before touching the provider
+            edit_buffer = layer.editBuffer()
+            fid = feature.id()
+            if edit_buffer is not None:
+                if edit_buffer.isFeatureAdded(fid):
+                    return "Feature is new (not yet saved to data source)."
+                if not (edit_buffer.isFeatureGeometryChanged(fid) or edit_buffer.isFeatureAttributesChanged(fid)):
+                    return "No pending changes detected."
+            
+            # Get original feature from data provider with a single fid-filtered request
+            request = QgsFeatureRequest().setFilterFid(fid)
+            original_feature = next(iter(layer.dataProvider().getFeatures(request)), None)
             
             # Compare current feature with original
-            if original_feature and original_feature.id() == feature.id():
+            if original_feature is not None and original_feature.id() == feature.id():
                 # Check geometry changes
                 original_geom = original_feature.geometry()
-                current_geom = feature.geometry()
+                current_geom = geometry
                 if original_geom and current_geom:
                     if not original_geom.equals(current_geom):
                         info_lines.append("Geometry: MODIFIED (pending)")
@@ -622,12 +705,7 @@ class SeeInfoPolygonAction(BaseAction):
                             area_change = current_area - original_area
                             crs = layer.crs()
                             try:
-                                if crs.isGeographic():
-                                    unit_name = "square degrees"
-                                elif crs.isValid() and crs.mapUnits() != 0:
-                                    unit_name = f"square {crs.mapUnits().name().lower()}"
-                                else:
-                                    unit_name = "square map units"
+                                unit_name = f"square {_get_crs_unit_name(crs) or 'map units'}"
                                 info_lines.append(f"  Area: {original_area:.2f} → {current_area:.2f} {unit_name} ({area_change:+.2f})")
                             except:
                                 info_lines.append(f"  Area: {original_area:.2f} → {current_area:.2f} ({area_change:+.2f})")
@@ -636,20 +714,18 @@ class SeeInfoPolygonAction(BaseAction):
                 
                 # Check attribute changes
                 original_attrs = original_feature.attributes()
-                current_attrs = feature.attributes()
+                current_attrs = attrs
                 fields = layer.fields()
                 
                 changed_attrs = []
-                for i, field in enumerate(fields):
-                    if i < len(original_attrs) and i < len(current_attrs):
-                        if original_attrs[i] != current_attrs[i]:
-                            field_name = field.name()
-                            old_value = original_attrs[i]
-                            new_value = current_attrs[i]
-                            if show_field_names:
-                                changed_attrs.append(f"  {field_name}: {old_value} → {new_value}")
-                            else:
-                                changed_attrs.append(f"  {field_name}: {old_value} → {new_value}")
+                # zip stops at the shortest list, so no per-index bounds checks are needed
+                for field, old_value, new_value in zip(fields, original_attrs, current_attrs):
+                    if old_value != new_value:
+                        field_name = field.name()
+                        if show_field_names:
+                            changed_attrs.append(f"  {field_name}: {old_value} → {new_value}")
+                        else:
+                            changed_attrs.append(f"  {field_name}: {old_value} → {new_value}")
                 
                 if changed_attrs:
                     info_lines.append("Attributes: MODIFIED (pending)")
@@ -664,11 +740,10 @@ class SeeInfoPolygonAction(BaseAction):
         
         return "\n".join(info_lines) if info_lines else None
     
-    def _get_geometry_info(self, feature, layer, show_field_names):
+    def _get_geometry_info(self, geometry, layer, show_field_names):
         """Get detailed geometry information for polygon."""
         info_lines = []
         
-        geometry = feature.geometry()
         if not geometry or geometry.isEmpty():
             return "No geometry"
         
@@ -691,29 +766,16 @@ class SeeInfoPolygonAction(BaseAction):
             # Polygon-specific info - Area (primary metric)
             area = geometry.area()
             crs = layer.crs()
+            # Resolve the units once for both area and perimeter
             try:
-                if crs.isGeographic():
-                    unit_name = "square degrees"
-                elif crs.isValid() and crs.mapUnits() != 0:
-                    unit_name = f"square {crs.mapUnits().name().lower()}"
-                else:
-                    unit_name = "square map units"
-                info_lines.append(f"Area: {area:.2f} {unit_name}")
+                unit_name = _get_crs_unit_name(crs) or "map units"
             except:
-                info_lines.append(f"Area: {area:.2f} square map units")
+                unit_name = "map units"
+            info_lines.append(f"Area: {area:.2f} square {unit_name}")
             
             # Perimeter/length
             perimeter = geometry.length()
-            try:
-                if crs.isGeographic():
-                    unit_name = "degrees"
-                elif crs.isValid() and crs.mapUnits() != 0:
-                    unit_name = crs.mapUnits().name().lower()
-                else:
-                    unit_name = "map units"
-                info_lines.append(f"Perimeter: {perimeter:.2f} {unit_name}")
-            except:
-                info_lines.append(f"Perimeter: {perimeter:.2f} map units")
+            info_lines.append(f"Perimeter: {perimeter:.2f} {unit_name}")
             
             # Count vertices (detailed)
             try:
@@ -757,12 +819,11 @@ class SeeInfoPolygonAction(BaseAction):
         
         return "\n".join(info_lines) if info_lines else None
     
-    def _get_attribute_info(self, feature, layer, show_field_names):
+    def _get_attribute_info(self, attributes, layer, show_field_names):
         """Get detailed attribute information."""
         info_lines = []
         
         fields = layer.fields()
-        attributes = feature.attributes()
         
         # Group fields by type for better organization
         field_groups = {
@@ -792,7 +853,7 @@ class SeeInfoPolygonAction(BaseAction):
                     category = 'Text'
                 elif field_type in [2, 4, 5, 6]:  # Numeric types
                     category = 'Numeric'
-                elif field_type in [14, 15, 16, 17, 18]:  # Date/Time types
+                elif field_type in _DATETIME_TYPES:
                     category = 'Date/Time'
                 elif field_type == 1:  # Boolean
                     category = 'Boolean'